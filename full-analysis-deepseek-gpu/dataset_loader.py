@@ -13,7 +13,9 @@ Date: 2025
 import pandas as pd
 import numpy as np
 from typing import List, Tuple, Dict, Optional
+import hashlib
 import os
+import pickle
 from pathlib import Path
 
 class DissertationDatasetLoader:
@@ -125,6 +127,47 @@ class DissertationDatasetLoader:
         
         return result
     
+    def get_balanced_sample_cached(self, n_samples: int = 100, random_state: int = 42,
+                                   cache_dir: str = ".cache") -> List[Tuple[str, str]]:
+        """
+        Get a balanced sample, reusing a pickled copy while the CSV is unchanged.
+        
+        The cache key covers the CSV path and modification time together with
+        the sampling parameters, so editing the dataset invalidates it.
+        
+        Args:
+            n_samples (int): Total number of samples to return
+            random_state (int): Random seed for reproducibility
+            cache_dir (str): Directory holding cached samples
+            
+        Returns:
+            List[Tuple[str, str]]: List of (message, label) tuples
+        """
+        if not os.path.exists(self.csv_path):
+            raise FileNotFoundError(f"Dataset file not found: {self.csv_path}")
+        
+        key_source = f"{os.path.abspath(self.csv_path)}|{os.path.getmtime(self.csv_path)}|{n_samples}|{random_state}"
+        key = hashlib.md5(key_source.encode("utf-8")).hexdigest()
+        cache_path = Path(cache_dir) / f"balanced_{key}.pkl"
+        
+        try:
+            with open(cache_path, "rb") as f:
+                result = pickle.load(f)
+            print(f"📋 Loaded cached balanced sample: {len(result)} messages")
+            return result
+        except (FileNotFoundError, pickle.UnpicklingError, EOFError):
+            pass
+        
+        result = self.get_balanced_sample(n_samples=n_samples, random_state=random_state)
+        
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+        
+        return result
+    
     def get_stratified_sample(self, n_samples: int = 200, maintain_ratio: bool = True, random_state: int = 42) -> List[Tuple[str, str]]:
         """
         Get a stratified sample maintaining the original class distribution.
@@ -193,6 +236,37 @@ class DissertationDatasetLoader:
         print(f"📋 Full dataset: {len(result)} messages")
         return result
     
+    def get_full_dataset_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the full dataset as parallel NumPy arrays, without building tuples.
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Messages (object array) and labels (int8, 1 = Toxic)
+        """
+        if not self.loaded:
+            self.load_dataset()
+        
+        messages = self.data['text'].to_numpy(dtype=object)
+        labels = self.data['true_label'].to_numpy(dtype=np.int8)
+        
+        print(f"📋 Full dataset: {len(messages)} messages")
+        return messages, labels
+    
+    @staticmethod
+    def to_arrays(samples: List[Tuple[str, str]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert (message, label) tuples into parallel NumPy arrays.
+        
+        Args:
+            samples (List[Tuple[str, str]]): List of (message, label) tuples
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Messages (object array) and labels (int8, 1 = Toxic)
+        """
+        messages = np.array([message for message, _ in samples], dtype=object)
+        labels = np.fromiter((label == 'Toxic' for _, label in samples), dtype=np.int8, count=len(samples))
+        return messages, labels
+    
     def get_dataset_statistics(self) -> Dict:
         """
         Get comprehensive statistics about the dataset.
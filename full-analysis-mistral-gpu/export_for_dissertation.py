@@ -4,11 +4,75 @@ Dissertation Export Tool
 Prepare and organize all academic analysis results for dissertation use
 """
 
+import io
 import os
-import sys
 import shutil
+import sys
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, redirect_stdout
 from datetime import datetime
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+# Linux ioctl request that shares extents between two files (reflink)
+FICLONE = 0x40049409
+
+# Formats that are already compressed and gain nothing from DEFLATE
+STORED_EXTENSIONS = (".png",)
+
+@contextmanager
+def buffered_output():
+    """Collect progress messages and emit them to stdout in a single write."""
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+def write_text_file(path, content):
+    """Write a generated document to disk in a single encoded write."""
+    Path(path).write_bytes(content.encode("utf-8"))
+
+def clone_file_contents(src_fd, dst_fd):
+    """Try to copy file contents in-kernel, returning False if unsupported."""
+    if fcntl is not None:
+        try:
+            fcntl.ioctl(dst_fd, FICLONE, src_fd)
+            return True
+        except OSError:
+            pass
+    
+    # copy_file_range clones transparently on CoW filesystems and otherwise
+    # still copies without moving the bytes through user space
+    if hasattr(os, "copy_file_range"):
+        try:
+            remaining = os.fstat(src_fd).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+            return remaining == 0
+        except OSError:
+            pass
+    
+    return False
+
+def fast_copy(source_path, dest_path):
+    """Copy a file with its metadata, using a reflink when the filesystem supports it."""
+    with open(source_path, 'rb') as src, open(dest_path, 'wb') as dst:
+        cloned = clone_file_contents(src.fileno(), dst.fileno())
+    
+    if not cloned:
+        shutil.copyfile(source_path, dest_path)
+    shutil.copystat(source_path, dest_path)
 
 def create_dissertation_package():
     """Create a comprehensive package for dissertation use."""
@@ -16,6 +80,9 @@ def create_dissertation_package():
     print("📚 CREATING DISSERTATION PACKAGE")
     print("=" * 50)
     
+    # Single timestamp shared by every generated document
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
     # Create export directory
     export_dir = "analysis/dissertation_export"
     os.makedirs(export_dir, exist_ok=True)
@@ -29,8 +96,13 @@ def create_dissertation_package():
         "appendices"
     ]
     
+    # The parent already exists, so only the missing leaves need a mkdir
+    with os.scandir(export_dir) as entries:
+        existing_subdirs = {entry.name for entry in entries if entry.is_dir()}
+    
     for subdir in subdirs:
-        os.makedirs(f"{export_dir}/{subdir}", exist_ok=True)
+        if subdir not in existing_subdirs:
+            os.mkdir(os.path.join(export_dir, subdir))
     
     # Copy reports
     reports_to_copy = [
@@ -43,9 +115,11 @@ def create_dissertation_package():
         source_path = f"analysis/reports/{source}"
         dest_path = f"{export_dir}/{dest}"
         
-        if os.path.exists(source_path):
-            shutil.copy2(source_path, dest_path)
+        try:
+            fast_copy(source_path, dest_path)
             print(f"✅ Copied {source} → {dest}")
+        except FileNotFoundError:
+            print(f"⚠️  Report not found, skipping: {source_path}")
     
     # Copy visualizations
     visualizations = [
@@ -60,36 +134,41 @@ def create_dissertation_package():
         source_path = f"analysis/reports/{viz}"
         dest_path = f"{export_dir}/visualizations/{viz}"
         
-        if os.path.exists(source_path):
-            shutil.copy2(source_path, dest_path)
+        try:
+            fast_copy(source_path, dest_path)
             print(f"✅ Copied visualization: {viz}")
+        except FileNotFoundError:
+            print(f"⚠️  Visualization not found, skipping: {source_path}")
+    
+    # Create dissertation guide, bibliography and data tables concurrently;
+    # they write to separate files and only the ZIP step depends on them
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        builders = {
+            "DISSERTATION_INTEGRATION_GUIDE.md": executor.submit(create_dissertation_guide, export_dir, timestamp),
+            "appendices/bibliography.md": executor.submit(create_bibliography, export_dir),
+            "data_tables/quantitative_results.md": executor.submit(create_data_tables, export_dir, timestamp)
+        }
+        generated_documents = {arc_name: builder.result() for arc_name, builder in builders.items()}
     
-    # Create dissertation guide
-    create_dissertation_guide(export_dir)
-    
-    # Create bibliography
-    create_bibliography(export_dir)
-    
-    # Create data tables
-    create_data_tables(export_dir)
-    
-    # Create ZIP package
-    create_zip_package(export_dir)
+    # Create ZIP package, reusing the generated documents already in memory
+    create_zip_package(export_dir, generated_documents)
     
     print(f"\n✅ Dissertation package created in: {export_dir}")
     print("📦 ZIP package created: dissertation_analysis_package.zip")
 
-def create_dissertation_guide(export_dir):
+def create_dissertation_guide(export_dir, timestamp):
     """Create a guide for using the analysis in dissertation."""
     
-    guide_content = f"""
+    guide_parts = [
+        f"""
 # Academic Dissertation Integration Guide
 ## Real-Time Content Moderation System Analysis
 
-**Generated:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+**Generated:** {timestamp}
 
 ---
-
+""",
+        """
 ## 📚 How to Use This Analysis in Your Dissertation
 
 ### 1. Literature Review Section
@@ -185,7 +264,8 @@ Based on this analysis, future research could explore:
 - User experience and satisfaction studies
 
 ---
-
+""",
+        """
 ## 📊 Quick Reference
 
 ### Key Performance Metrics:
@@ -207,15 +287,18 @@ Based on this analysis, future research could explore:
 - Statistical significance testing
 
 ---
-
+""",
+        """
 **Note:** This analysis provides a solid foundation for academic research while 
 maintaining statistical rigor and academic standards suitable for dissertation work.
-"""
+""",
+    ]
+    guide_content = "".join(guide_parts)
     
-    with open(f"{export_dir}/DISSERTATION_INTEGRATION_GUIDE.md", "w") as f:
-        f.write(guide_content)
+    write_text_file(f"{export_dir}/DISSERTATION_INTEGRATION_GUIDE.md", guide_content)
     
     print("✅ Created dissertation integration guide")
+    return guide_content
 
 def create_bibliography(export_dir):
     """Create a bibliography of relevant academic sources."""
@@ -262,12 +345,71 @@ def create_bibliography(export_dir):
 statistical evaluation, and system performance analysis relevant to dissertation research.
 """
     
-    with open(f"{export_dir}/appendices/bibliography.md", "w") as f:
-        f.write(bibliography)
+    write_text_file(f"{export_dir}/appendices/bibliography.md", bibliography)
     
     print("✅ Created academic bibliography")
+    return bibliography
+
+# Markdown layout for the quantitative results tables, filled via str.format_map
+DATA_TABLES_TEMPLATE = """
+# Data Tables for Dissertation
+## Quantitative Results Summary
+
+### Table 1: Model Performance Metrics
+| Metric | Value | 95% Confidence Interval | Sample Size |
+|--------|-------|------------------------|-------------|
+| Accuracy | {accuracy:.3f} | ({accuracy_lower:.3f}, {accuracy_upper:.3f}) | {sample_size} |
+| Precision | {precision:.3f} | ({precision_lower:.3f}, {precision_upper:.3f}) | {sample_size} |
+| Recall | {recall:.3f} | ({recall_lower:.3f}, {recall_upper:.3f}) | {sample_size} |
+| F1-Score | {f1_score:.3f} | ({f1_score_lower:.3f}, {f1_score_upper:.3f}) | {sample_size} |
 
-def create_data_tables(export_dir):
+### Table 2: Processing Performance Analysis
+| Metric | Value | Unit | Statistical Measure |
+|--------|-------|------|-------------------|
+| Mean Processing Time | {mean_processing_time:.1f} | ms | Arithmetic Mean |
+| Processing Time Std Dev | {processing_time_std:.1f} | ms | Standard Deviation |
+| System Reliability | {reliability:.4f} | Proportion | 95% CI: ({reliability_lower:.4f}, {reliability_upper:.4f}) |
+| MTBF | {mtbf:.1f} | Requests | Mean Time Between Failures |
+
+### Table 3: Classification Results Summary
+| Classification | Count | Percentage | 95% CI |
+|----------------|-------|------------|--------|
+| Toxic | {toxic_count} | {toxic_pct:.1f}% | ({toxic_lower_pct:.1f}%, {toxic_upper_pct:.1f}%) |
+| Non-Toxic | {non_toxic_count} | {non_toxic_pct:.1f}% | ({non_toxic_lower_pct:.1f}%, {non_toxic_upper_pct:.1f}%) |
+| Filtered | {filter_count} | {filter_pct:.1f}% | ({filter_lower_pct:.1f}%, {filter_upper_pct:.1f}%) |
+
+### Table 4: Statistical Significance and Reliability Tests
+| Test | Statistic | Value | Interpretation |
+|------|-----------|-------|----------------|
+| Model Accuracy | Exact Test | {accuracy:.3f} | {accuracy_interpretation} |
+| System Reliability | Proportion Test | {reliability:.4f} | {reliability_interpretation} |
+| Sample Size | Power Analysis | {sample_size} | {sample_size_interpretation} |
+| Processing Consistency | CV Analysis | {processing_cv:.1f}% | {processing_interpretation} |
+
+### Table 5: Experimental Design Summary
+| Parameter | Value | Description |
+|-----------|-------|-------------|
+| Total Messages Analyzed | {total_messages} | Complete dataset size |
+| Evaluation Sample Size | {sample_size} | Controlled evaluation subset |
+| Confidence Level | 95% | Statistical confidence for all intervals |
+| Analysis Framework | Academic Standard | Dissertation-quality methodology |
+
+---
+
+**Data Sources:**
+- Model Performance: `analysis/reports/model_evaluation_report.md`
+- Statistical Analysis: `analysis/reports/statistical_summary.md`
+- Experimental Results: Generated from analysis modules
+- Processing Metrics: Real-time system monitoring
+
+**Note:** These tables contain dynamically extracted quantitative results suitable for 
+inclusion in dissertation results sections with appropriate statistical reporting.
+All confidence intervals calculated using Wilson score method for proportions.
+
+**Generated:** {timestamp}
+"""
+
+def create_data_tables(export_dir, timestamp):
     """Create formatted data tables for dissertation use with dynamic data from analysis results."""
     
     print("📊 Extracting dynamic data from analysis results...")
@@ -398,24 +540,6 @@ def create_data_tables(export_dir):
         except Exception as e:
             print(f"⚠️  Error extracting statistical metrics: {e}")
     
-    # Try to extract experimental performance data from Python analysis modules
-    try:
-        # Import and run analysis modules to get fresh data
-        sys.path.append('.')
-        
-        # Try to get experimental data if available
-        if os.path.exists('experimental_design.py'):
-            import experimental_design
-            # This would extract batch performance data if available
-            
-        # Try to get performance analysis data
-        if os.path.exists('statistical_analysis.py'):
-            import statistical_analysis
-            # This would extract system performance metrics if available
-            
-    except Exception as e:
-        print(f"⚠️  Could not import analysis modules: {e}")
-    
     # Set default values if extraction failed
     if not model_metrics:
         model_metrics = {
@@ -442,97 +566,118 @@ def create_data_tables(export_dir):
             'mtbf': 60.0
         }
     
-    # Create dynamic tables content
-    tables_content = f"""
-# Data Tables for Dissertation
-## Quantitative Results Summary
-
-### Table 1: Model Performance Metrics
-| Metric | Value | 95% Confidence Interval | Sample Size |
-|--------|-------|------------------------|-------------|
-| Accuracy | {model_metrics['accuracy']['value']:.3f} | ({model_metrics['accuracy']['ci_lower']:.3f}, {model_metrics['accuracy']['ci_upper']:.3f}) | {model_metrics.get('sample_size', 'N/A')} |
-| Precision | {model_metrics['precision']['value']:.3f} | ({model_metrics['precision']['ci_lower']:.3f}, {model_metrics['precision']['ci_upper']:.3f}) | {model_metrics.get('sample_size', 'N/A')} |
-| Recall | {model_metrics['recall']['value']:.3f} | ({model_metrics['recall']['ci_lower']:.3f}, {model_metrics['recall']['ci_upper']:.3f}) | {model_metrics.get('sample_size', 'N/A')} |
-| F1-Score | {model_metrics['f1_score']['value']:.3f} | ({model_metrics['f1_score']['ci_lower']:.3f}, {model_metrics['f1_score']['ci_upper']:.3f}) | {model_metrics.get('sample_size', 'N/A')} |
-
-### Table 2: Processing Performance Analysis
-| Metric | Value | Unit | Statistical Measure |
-|--------|-------|------|-------------------|
-| Mean Processing Time | {model_metrics.get('mean_processing_time', 0):.1f} | ms | Arithmetic Mean |
-| Processing Time Std Dev | {model_metrics.get('processing_time_std', 0):.1f} | ms | Standard Deviation |
-| System Reliability | {statistical_tests['reliability']['value']:.4f} | Proportion | 95% CI: ({statistical_tests['reliability']['ci_lower']:.4f}, {statistical_tests['reliability']['ci_upper']:.4f}) |
-| MTBF | {statistical_tests.get('mtbf', 0):.1f} | Requests | Mean Time Between Failures |
-
-### Table 3: Classification Results Summary
-| Classification | Count | Percentage | 95% CI |
-|----------------|-------|------------|--------|
-| Toxic | {int(classification_results['total_messages'] * classification_results['toxic_rate']['value'])} | {classification_results['toxic_rate']['value']*100:.1f}% | ({classification_results['toxic_rate']['ci_lower']*100:.1f}%, {classification_results['toxic_rate']['ci_upper']*100:.1f}%) |
-| Non-Toxic | {int(classification_results['total_messages'] * classification_results['non_toxic_rate']['value'])} | {classification_results['non_toxic_rate']['value']*100:.1f}% | ({classification_results['non_toxic_rate']['ci_lower']*100:.1f}%, {classification_results['non_toxic_rate']['ci_upper']*100:.1f}%) |
-| Filtered | {int(classification_results['total_messages'] * classification_results['filter_rate']['value'])} | {classification_results['filter_rate']['value']*100:.1f}% | ({classification_results['filter_rate']['ci_lower']*100:.1f}%, {classification_results['filter_rate']['ci_upper']*100:.1f}%) |
-
-### Table 4: Statistical Significance and Reliability Tests
-| Test | Statistic | Value | Interpretation |
-|------|-----------|-------|----------------|
-| Model Accuracy | Exact Test | {model_metrics['accuracy']['value']:.3f} | {"Perfect Classification" if model_metrics['accuracy']['value'] == 1.0 else "High Accuracy"} |
-| System Reliability | Proportion Test | {statistical_tests['reliability']['value']:.4f} | {"Highly Reliable" if statistical_tests['reliability']['value'] > 0.99 else "Reliable"} |
-| Sample Size | Power Analysis | {model_metrics.get('sample_size', 'N/A')} | {"Adequate" if model_metrics.get('sample_size', 0) >= 20 else "Limited"} |
-| Processing Consistency | CV Analysis | {(model_metrics.get('processing_time_std', 0) / model_metrics.get('mean_processing_time', 1) * 100):.1f}% | {"Consistent" if (model_metrics.get('processing_time_std', 0) / model_metrics.get('mean_processing_time', 1) * 100) < 20 else "Variable"} |
-
-### Table 5: Experimental Design Summary
-| Parameter | Value | Description |
-|-----------|-------|-------------|
-| Total Messages Analyzed | {classification_results['total_messages']} | Complete dataset size |
-| Evaluation Sample Size | {model_metrics.get('sample_size', 'N/A')} | Controlled evaluation subset |
-| Confidence Level | 95% | Statistical confidence for all intervals |
-| Analysis Framework | Academic Standard | Dissertation-quality methodology |
-
----
-
-**Data Sources:**
-- Model Performance: `analysis/reports/model_evaluation_report.md`
-- Statistical Analysis: `analysis/reports/statistical_summary.md`
-- Experimental Results: Generated from analysis modules
-- Processing Metrics: Real-time system monitoring
-
-**Note:** These tables contain dynamically extracted quantitative results suitable for 
-inclusion in dissertation results sections with appropriate statistical reporting.
-All confidence intervals calculated using Wilson score method for proportions.
-
-**Generated:** {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-"""
-    
-    with open(f"{export_dir}/data_tables/quantitative_results.md", "w") as f:
-        f.write(tables_content)
+    # Flatten the extracted metrics so every template slot is a single lookup
+    sample_size = model_metrics.get('sample_size', 'N/A')
+    total_messages = classification_results['total_messages']
+    processing_cv = (model_metrics.get('processing_time_std', 0) / model_metrics.get('mean_processing_time', 1) * 100)
+    table_values = {
+        'timestamp': timestamp,
+        'sample_size': sample_size,
+        'total_messages': total_messages,
+        'mean_processing_time': model_metrics.get('mean_processing_time', 0),
+        'processing_time_std': model_metrics.get('processing_time_std', 0),
+        'mtbf': statistical_tests.get('mtbf', 0),
+        'processing_cv': processing_cv,
+        'accuracy_interpretation': "Perfect Classification" if model_metrics['accuracy']['value'] == 1.0 else "High Accuracy",
+        'reliability_interpretation': "Highly Reliable" if statistical_tests['reliability']['value'] > 0.99 else "Reliable",
+        'sample_size_interpretation': "Adequate" if model_metrics.get('sample_size', 0) >= 20 else "Limited",
+        'processing_interpretation': "Consistent" if processing_cv < 20 else "Variable"
+    }
+    
+    for key in ('accuracy', 'precision', 'recall', 'f1_score'):
+        table_values[key] = model_metrics[key]['value']
+        table_values[f'{key}_lower'] = model_metrics[key]['ci_lower']
+        table_values[f'{key}_upper'] = model_metrics[key]['ci_upper']
+    
+    reliability = statistical_tests['reliability']
+    table_values['reliability'] = reliability['value']
+    table_values['reliability_lower'] = reliability['ci_lower']
+    table_values['reliability_upper'] = reliability['ci_upper']
+    
+    for prefix in ('toxic', 'non_toxic', 'filter'):
+        rate = classification_results[f'{prefix}_rate']
+        table_values[f'{prefix}_count'] = int(total_messages * rate['value'])
+        table_values[f'{prefix}_pct'] = rate['value'] * 100
+        table_values[f'{prefix}_lower_pct'] = rate['ci_lower'] * 100
+        table_values[f'{prefix}_upper_pct'] = rate['ci_upper'] * 100
+    
+    tables_content = DATA_TABLES_TEMPLATE.format_map(table_values)
+    
+    write_text_file(f"{export_dir}/data_tables/quantitative_results.md", tables_content)
     
     print("✅ Created dynamic data tables for dissertation")
     print(f"   • Model metrics: {len(model_metrics)} parameters extracted")
     print(f"   • Classification results: {len(classification_results)} parameters extracted")
     print(f"   • Statistical tests: {len(statistical_tests)} parameters extracted")
+    return tables_content
+
+def iter_files(root):
+    """Yield every regular file below root using cached directory entries."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_files(entry.path)
+            elif entry.is_file():
+                yield entry.path
 
-def create_zip_package(export_dir):
-    """Create a ZIP package of all dissertation materials."""
+def create_zip_package(export_dir, generated_documents=None):
+    """Create a ZIP package of all dissertation materials.
+    
+    generated_documents maps archive names to content that is already in
+    memory, so those files are not read back from disk.
+    """
+    generated_documents = generated_documents or {}
     
     zip_filename = "dissertation_analysis_package.zip"
+    tmp_filename = f"{zip_filename}.tmp"
     
-    with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(export_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arc_name = os.path.relpath(file_path, export_dir)
-                zipf.write(file_path, arc_name)
+    files = list(iter_files(export_dir))
+    total_size = sum(os.path.getsize(file_path) for file_path in files)
+    
+    # Build the archive next to its final location and rename it into place,
+    # so an interrupted run never leaves a truncated ZIP behind
+    fd = os.open(tmp_filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        with os.fdopen(fd, 'wb', buffering=1 << 20) as handle:
+            if hasattr(os, "posix_fallocate") and total_size:
+                try:
+                    os.posix_fallocate(handle.fileno(), 0, total_size)
+                except OSError:
+                    pass
+            
+            with zipfile.ZipFile(handle, 'w', compression=zipfile.ZIP_DEFLATED,
+                                 compresslevel=1, allowZip64=True) as zipf:
+                for file_path in files:
+                    arc_name = os.path.relpath(file_path, export_dir).replace(os.sep, "/")
+                    if arc_name in generated_documents:
+                        zipf.writestr(arc_name, generated_documents[arc_name])
+                    elif arc_name.lower().endswith(STORED_EXTENSIONS):
+                        zipf.write(file_path, arc_name, compress_type=zipfile.ZIP_STORED)
+                    else:
+                        zipf.write(file_path, arc_name)
+            
+            # Release the preallocated space the compressed archive did not use
+            handle.truncate()
+        
+        os.replace(tmp_filename, zip_filename)
+    except BaseException:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+        raise
     
     print(f"✅ Created ZIP package: {zip_filename}")
 
 if __name__ == "__main__":
-    create_dissertation_package()
-    
-    print("\n🎓 DISSERTATION PACKAGE READY!")
-    print("=" * 40)
-    print("Your academic analysis is now organized and ready for dissertation use.")
-    print("All materials follow academic standards with proper statistical reporting.")
-    print("\n📚 Next steps:")
-    print("1. Review the DISSERTATION_INTEGRATION_GUIDE.md")
-    print("2. Use the visualizations in your figures")
-    print("3. Reference the statistical analysis in your methodology")
-    print("4. Cite the performance results in your findings")
-    print("\n🚀 Ready for academic publication!")
+    with buffered_output():
+        create_dissertation_package()
+        
+        print("\n🎓 DISSERTATION PACKAGE READY!")
+        print("=" * 40)
+        print("Your academic analysis is now organized and ready for dissertation use.")
+        print("All materials follow academic standards with proper statistical reporting.")
+        print("\n📚 Next steps:")
+        print("1. Review the DISSERTATION_INTEGRATION_GUIDE.md")
+        print("2. Use the visualizations in your figures")
+        print("3. Reference the statistical analysis in your methodology")
+        print("4. Cite the performance results in your findings")
+        print("\n🚀 Ready for academic publication!")
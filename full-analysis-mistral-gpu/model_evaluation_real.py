@@ -11,16 +11,20 @@ Author: Academic Research
 Date: 2025
 """
 
-import requests
+import asyncio
+import httpx
+import itertools
 import json
+import orjson
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
-from sklearn.metrics import confusion_matrix, classification_report, roc_auc_score, roc_curve
+from sklearn.metrics import precision_recall_fscore_support
+from sklearn.metrics import confusion_matrix, roc_auc_score, roc_curve
 from sklearn.metrics import precision_recall_curve, average_precision_score
+from dataclasses import dataclass
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
@@ -28,6 +32,218 @@ warnings.filterwarnings('ignore')
 # Import our dataset loader
 from dataset_loader import DissertationDatasetLoader
 
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Markdown layout of the academic evaluation report, filled by generate_academic_report
+_REPORT_TEMPLATE = """# Model Performance Evaluation Report
+## Real Dataset Analysis - {date}
+
+### Executive Summary
+This report presents a comprehensive evaluation of the real-time moderation system using the SetFit/toxic_conversations dataset. The evaluation employed a {mode} approach to accommodate server constraints.
+
+### Dataset Information
+- **Source**: SetFit/toxic_conversations (Hugging Face)
+- **Total Dataset Size**: {dataset_size:,} samples
+- **Evaluation Sample Size**: {dataset_info[total_samples]} samples
+- **Class Distribution**:
+  - Toxic messages: {dataset_info[toxic_samples]} ({toxic_share:.1%})
+  - Non-toxic messages: {dataset_info[non_toxic_samples]} ({non_toxic_share:.1%})
+
+### Evaluation Configuration
+- **Resource-Friendly Mode**: {resource_friendly}
+- **Request Delay**: {request_delay}s
+- **Timeout**: {timeout}s
+- **Max Retries**: {max_retries}
+- **Success Rate**: {dataset_info[success_rate]:.1%}
+
+### Performance Metrics
+
+#### Classification Performance
+- **Accuracy**: {accuracy:.4f} ({accuracy:.1%})
+- **Precision**: {precision:.4f} ({precision:.1%})
+- **Recall**: {recall:.4f} ({recall:.1%})
+- **F1-Score**: {f1_score:.4f} ({f1_score:.1%})
+- **ROC AUC**: {roc_auc_text}
+
+#### Response Time Analysis
+- **Mean Response Time**: {response_time_stats[mean]:.3f} seconds
+- **Median Response Time**: {response_time_stats[median]:.3f} seconds
+- **Standard Deviation**: {response_time_stats[std]:.3f} seconds
+- **Min Response Time**: {response_time_stats[min]:.3f} seconds
+- **Max Response Time**: {response_time_stats[max]:.3f} seconds
+
+### Confusion Matrix Analysis
+The confusion matrix reveals the following classification patterns:
+{confusion_matrix_text}
+
+### Per-Class Performance Analysis
+
+#### Non-Toxic Class Performance
+- **Precision**: {classification_report[Non-Toxic][precision]:.4f}
+- **Recall**: {classification_report[Non-Toxic][recall]:.4f}
+- **F1-Score**: {classification_report[Non-Toxic][f1-score]:.4f}
+- **Support**: {classification_report[Non-Toxic][support]} samples
+
+#### Toxic Class Performance
+- **Precision**: {classification_report[Toxic][precision]:.4f}
+- **Recall**: {classification_report[Toxic][recall]:.4f}
+- **F1-Score**: {classification_report[Toxic][f1-score]:.4f}
+- **Support**: {classification_report[Toxic][support]} samples
+
+### Statistical Significance
+The evaluation was conducted using real-world data from the SetFit/toxic_conversations dataset, providing high external validity. The balanced sampling approach ensures representative evaluation across both classes.
+
+### Resource Management Analysis
+The {mode} evaluation approach was employed:
+- **Request Success Rate**: {dataset_info[success_rate]:.1%}
+- **Failed Requests**: {failed_requests}
+- **Total Requests**: {total_requests}
+
+### Recommendations
+
+#### Performance Optimization
+1. **Accuracy Improvement**: Current accuracy of {accuracy:.1%} {accuracy_verdict} typical production standards (85%+)
+2. **Precision-Recall Balance**: {balance_verdict} precision ({precision:.3f}) and recall ({recall:.3f})
+3. **Response Time**: Average response time of {response_time_stats[mean]:.2f}s {latency_verdict} for real-time applications
+
+#### Resource Management
+1. **Server Optimization**: {server_verdict}
+2. **Scaling Considerations**: Current configuration supports evaluation workloads with {dataset_info[success_rate]:.1%} success rate
+
+### Conclusion
+The moderation system demonstrates {performance_verdict} performance on real-world toxic conversation data. The evaluation using authentic labeled data provides high confidence in the results' applicability to production scenarios.
+
+### Technical Details
+- **Evaluation Date**: {date}
+- **Dataset Source**: SetFit/toxic_conversations
+- **Evaluation Framework**: Custom academic evaluation suite
+- **Statistical Methods**: Scikit-learn metrics with balanced sampling
+- **Visualization**: Comprehensive performance dashboard generated
+
+---
+*This report was generated automatically by the Model Performance Evaluator using real labeled data for academic research purposes.*
+"""
+
+@dataclass
+class _CircuitBreaker:
+    """
+    Closed/Open/Half-Open circuit breaker shared by all evaluation requests.
+    
+    After ``fail_threshold`` consecutive server failures the breaker opens and
+    requests fail fast; once ``reset_timeout`` seconds have passed a single
+    trial request is let through to decide whether to close it again.
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    state: str = CLOSED
+    fail_count: int = 0
+    opened_at: float = 0.0
+    fail_threshold: int = 5
+    reset_timeout: float = 60.0
+    
+    def allow_request(self):
+        """Whether a request may be sent now (the caller becomes the trial when half-opening)."""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and time.monotonic() - self.opened_at > self.reset_timeout:
+            print("🔄 Circuit breaker half-open, sending a trial request")
+            self.state = self.HALF_OPEN
+            return True
+        return False
+    
+    def record_success(self):
+        """Close the breaker after the server handled a request."""
+        self.state = self.CLOSED
+        self.fail_count = 0
+    
+    def record_failure(self):
+        """Count a timeout or server error, opening the breaker at the threshold."""
+        self.fail_count += 1
+        if self.state == self.HALF_OPEN or self.fail_count >= self.fail_threshold:
+            if self.state != self.OPEN:
+                print(f"🚨 Circuit breaker open after {self.fail_count} consecutive failures, failing fast for {self.reset_timeout:.0f}s")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+class _TokenBucket:
+    """
+    Token-bucket pacing for request starts (implemented as GCRA).
+    
+    Callers only wait as long as needed to stay under ``rate`` requests per
+    second on average, with up to ``capacity`` requests allowed back to back.
+    """
+    
+    def __init__(self, rate, capacity=1):
+        self.interval = 1.0 / rate
+        self.tolerance = (capacity - 1) * self.interval
+        self.next_free = time.monotonic()  # Theoretical arrival time of the next request
+    
+    async def acquire(self):
+        """Reserve a slot and sleep until it is due."""
+        now = time.monotonic()
+        self.next_free = max(self.next_free, now)
+        wait = self.next_free - self.tolerance - now
+        self.next_free += self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+class _AdaptiveConcurrency:
+    """
+    AIMD limit on evaluation requests in flight.
+    
+    Starts at one request; after every ``window`` completed requests the limit
+    grows by one if all of them succeeded comfortably within ``latency_target``,
+    and is halved if any of them failed.
+    """
+    
+    def __init__(self, max_limit, latency_target, window=5):
+        self.limit = 1
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.window = window
+        self.in_flight = 0
+        self.successes = 0
+        self.failures = 0
+        self.latency_total = 0.0
+        self.condition = asyncio.Condition()
+    
+    async def __aenter__(self):
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+    
+    async def __aexit__(self, *exc_info):
+        async with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+    
+    def record(self, ok, latency=0.0):
+        """Count one completed request and adjust the limit at the end of a window."""
+        if ok:
+            self.successes += 1
+            self.latency_total += latency
+        else:
+            self.failures += 1
+        
+        if self.successes + self.failures < self.window:
+            return
+        
+        if self.failures:
+            new_limit = max(1, self.limit // 2)
+        elif self.latency_total / self.successes < self.latency_target:
+            new_limit = min(self.max_limit, self.limit + 1)
+        else:
+            new_limit = self.limit
+        if new_limit != self.limit:
+            print(f"{'📈' if new_limit > self.limit else '📉'} Concurrency limit {self.limit} → {new_limit}")
+            self.limit = new_limit
+        
+        self.successes = self.failures = 0
+        self.latency_total = 0.0
+
 class ModelPerformanceEvaluator:
     """
     Comprehensive model performance evaluator using real labeled dataset.
@@ -43,17 +259,31 @@ class ModelPerformanceEvaluator:
             resource_friendly (bool): Enable resource-friendly evaluation mode
         """
         self.evaluation_data = {}
-        self.ground_truth = []
-        self.predictions = []
-        self.prediction_probabilities = []
+        # Per-sample results as contiguous arrays (1 = Toxic), filled by collect_evaluation_data
+        self.y_true = np.empty(0, dtype=np.int8)
+        self.y_pred = np.empty(0, dtype=np.int8)
+        self.prediction_probabilities = np.empty(0, dtype=np.float32)
+        self.response_times = np.empty(0, dtype=np.float32)
+        self._metrics_cache = None  # Metrics for the current arrays, reset on each collection
         
         # Ultra-conservative configuration for overloaded Mistral server
         self.resource_friendly = resource_friendly
-        self.request_delay = 10.0 if resource_friendly else 2.0     # Much longer delay between requests
+        self.request_delay = 10.0 if resource_friendly else 2.0     # Base retry delay and request spacing
+        self.target_rps = 1.0 / self.request_delay                  # Average request starts per second
+        self.rate_burst = 1 if resource_friendly else 2             # Requests allowed back to back
         self.timeout = 60.0 if resource_friendly else 45.0         # Extended timeout for slow generation
         self.max_retries = 3 if resource_friendly else 5           # Fewer retries to avoid pile-up
-        self.batch_delay = 15.0 if resource_friendly else 5.0      # Long delay between batches
-        self.max_concurrent = 1                                     # Only 1 request at a time
+        self.max_backoff = 60.0                                     # Upper bound for a single retry backoff
+        self.max_concurrent = 4 if resource_friendly else 16        # Ceiling for the adaptive in-flight limit
+        self.batch_size = 8                                         # Messages per batch request
+        self.batch_endpoint_available = True                        # Cleared if the server lacks the batch route
+        self.keep_full_responses = False                            # Keep message text and raw API responses (debugging)
+        
+        # Single pooled client target; request starts are paced to target_rps
+        self.base_url = 'http://localhost:8002'
+        self.breaker = _CircuitBreaker()  # Stops hammering the server while it is down
+        self.concurrency = None           # Per-run AIMD in-flight limit
+        self.rate_limiter = None          # Per-run request pacing
         
         # Load the real dataset
         self.dataset_loader = DissertationDatasetLoader(csv_path)
@@ -74,8 +304,8 @@ class ModelPerformanceEvaluator:
                 test_messages = self.dataset_loader.get_full_dataset()
                 print(f"📊 Evaluating model with entire dataset ({len(test_messages)} messages)...")
             else:
-                # Use balanced sample for smaller evaluation
-                test_messages = self.dataset_loader.get_balanced_sample(
+                # Use balanced sample for smaller evaluation (cached on disk across runs)
+                test_messages = self.dataset_loader.get_balanced_sample_cached(
                     n_samples=sample_size, 
                     random_state=42
                 )
@@ -84,119 +314,38 @@ class ModelPerformanceEvaluator:
             print(f"📊 Evaluating model with {len(test_messages)} custom test messages...")
         
         print(f"⚙️  Ultra-conservative mode for overloaded Mistral server:")
-        print(f"   • Request delay: {self.request_delay}s")
+        print(f"   • Request rate: {self.target_rps:.2f} req/s (burst {self.rate_burst})")
         print(f"   • Timeout: {self.timeout}s")
         print(f"   • Max retries: {self.max_retries}")
-        print(f"   • Batch delay: {self.batch_delay}s")
-        print(f"   • Processing 1 request at a time to avoid server overload")
+        print(f"   • Concurrent requests: adaptive, 1-{self.max_concurrent}")
+        print(f"   • Batch size: {self.batch_size}")
         
-        results = []
-        failed_requests = 0
+        # Preallocate result buffers; successful samples are written at self._n
+        n = len(test_messages)
+        self._y_true = np.empty(n, dtype=np.int8)
+        self._y_pred = np.empty(n, dtype=np.int8)
+        self._probs = np.empty(n, dtype=np.float32)
+        self._rt = np.empty(n, dtype=np.float32)
+        self._n = 0
         
-        for i, (message, true_label) in enumerate(test_messages):
-            success = False
-            retry_count = 0
-            
-            while not success and retry_count < self.max_retries:
-                try:
-                    # Resource-friendly delay
-                    if i > 0:  # Don't delay before first request
-                        time.sleep(self.request_delay)
-                    
-                    # Send message to Chat Simulator API (proper entry point)
-                    response = requests.post(
-                        'http://localhost:8002/api/send-message',
-                        json={
-                            'message': message,
-                            'user_id': f'test_user_{i}',
-                            'username': f'TestUser{i}',
-                            'channel_id': 'evaluation_channel'
-                        },
-                        timeout=self.timeout
-                    )
-                    
-                    if response.status_code == 200:
-                        result = response.json()
-                        
-                        # Extract prediction and confidence from Chat Simulator API response
-                        # The Chat Simulator API returns the full moderation result
-                        moderation_result = result.get('result', {}).get('moderation_result', {})
-                        
-                        # Determine if message was flagged - use 'decision' field from API
-                        decision = moderation_result.get('decision', 'Non-Toxic')
-                        predicted_label = decision  # Direct mapping: "Toxic" or "Non-Toxic"
-                        
-                        # Extract confidence score
-                        confidence = moderation_result.get('confidence', 0.5)
-                        
-                        # Extract processing time - convert from milliseconds to seconds
-                        processing_time_ms = moderation_result.get('processing_time_ms', 0)
-                        processing_time = processing_time_ms / 1000.0  # Convert to seconds
-                        
-                        # Store results
-                        results.append({
-                            'message': message,
-                            'true_label': true_label,
-                            'predicted_label': predicted_label,
-                            'confidence': confidence,
-                            'response_time': processing_time,
-                            'decision': decision,
-                            'full_response': result,
-                            'moderation_result': moderation_result
-                        })
-                        
-                        self.ground_truth.append(true_label)
-                        self.predictions.append(predicted_label)
-                        self.prediction_probabilities.append(confidence if predicted_label == "Toxic" else 1-confidence)
-                        
-                        success = True
-                        
-                        # Progress indicator
-                        if (i + 1) % 10 == 0:
-                            print(f"✅ Processed {i + 1}/{len(test_messages)} messages")
-                    
-                    else:
-                        retry_count += 1
-                        if retry_count < self.max_retries:
-                            print(f"⚠️  Request failed (status {response.status_code}), retrying in {self.request_delay * 2}s... (attempt {retry_count + 1}/{self.max_retries})")
-                            time.sleep(self.request_delay * 2)  # Longer delay on retry
-                        else:
-                            print(f"❌ Request failed after {self.max_retries} attempts: {response.status_code}")
-                            failed_requests += 1
-                
-                except requests.exceptions.Timeout:
-                    retry_count += 1
-                    if retry_count < self.max_retries:
-                        backoff_delay = self.request_delay * (2 ** retry_count)  # Exponential backoff
-                        print(f"⏰ Request timeout (server overloaded), backing off {backoff_delay:.1f}s... (attempt {retry_count + 1}/{self.max_retries})")
-                        time.sleep(backoff_delay)
-                    else:
-                        print(f"❌ Request timed out after {self.max_retries} attempts - server likely overloaded")
-                        failed_requests += 1
-                
-                except requests.exceptions.RequestException as e:
-                    retry_count += 1
-                    if retry_count < self.max_retries:
-                        backoff_delay = self.request_delay * (1.5 ** retry_count)
-                        print(f"🔌 Connection error (server overloaded), backing off {backoff_delay:.1f}s... (attempt {retry_count + 1}/{self.max_retries})")
-                        time.sleep(backoff_delay)
-                    else:
-                        print(f"❌ Connection failed after {self.max_retries} attempts: {e}")
-                        failed_requests += 1
-            
-            # Adaptive batch delay based on failure rate
-            if (i + 1) % 5 == 0 and i < len(test_messages) - 1:  # Every 5 messages instead of 10
-                # Increase delay if we're seeing failures
-                failure_rate = failed_requests / (i + 1) if i > 0 else 0
-                adaptive_delay = self.batch_delay * (1 + failure_rate * 2)  # Increase delay based on failures
-                print(f"⏸️  Adaptive batch delay ({adaptive_delay:.1f}s) - failure rate: {failure_rate:.1%}")
-                time.sleep(adaptive_delay)
+        results, failed_requests, short_circuited = asyncio.run(self._collect_async(test_messages))
+        
+        self.y_true = self._y_true[:self._n]
+        self.y_pred = self._y_pred[:self._n]
+        self.prediction_probabilities = self._probs[:self._n]
+        
+        # Turn raw confidences into P(Toxic) in place: 1 - confidence where predicted Non-Toxic
+        np.subtract(1.0, self.prediction_probabilities, out=self.prediction_probabilities,
+                    where=self.y_pred == 0)
+        self.response_times = self._rt[:self._n]
+        self._metrics_cache = None
         
         self.evaluation_data = {
             'results': results,
             'total_requests': len(test_messages),
             'successful_requests': len(results),
             'failed_requests': failed_requests,
+            'short_circuited_requests': short_circuited,
             'success_rate': len(results) / len(test_messages) if test_messages else 0
         }
         
@@ -204,10 +353,250 @@ class ModelPerformanceEvaluator:
         print(f"   • Total requests: {len(test_messages)}")
         print(f"   • Successful: {len(results)}")
         print(f"   • Failed: {failed_requests}")
+        if short_circuited:
+            print(f"   • Skipped by circuit breaker: {short_circuited}")
         print(f"   • Success rate: {self.evaluation_data['success_rate']:.1%}")
         
         return self.evaluation_data
     
+    async def _collect_async(self, test_messages):
+        """
+        Send evaluation requests with bounded concurrency over one pooled client.
+        
+        Messages are sent in groups of ``self.batch_size`` through the batch endpoint
+        (falling back to one request per message). The number of requests in flight
+        adapts between 1 and ``self.max_concurrent`` (AIMD), while a token bucket
+        keeps request starts under ``self.target_rps``, so server latency overlaps
+        instead of adding up per message. Duplicate message texts are sent once and
+        their prediction is recorded for every copy.
+        
+        Returns:
+            tuple: (results in input order, number of failed requests,
+                    number of those skipped by the circuit breaker)
+        """
+        outcomes = [None] * len(test_messages)
+        failed_requests = 0
+        short_circuited = 0
+        completed = 0
+        
+        # Original positions of each distinct message text
+        copies = {}
+        for i, (message, _) in enumerate(test_messages):
+            copies.setdefault(message, []).append(i)
+        if len(copies) < len(test_messages):
+            print(f"🔁 Sending {len(copies)} unique messages ({len(test_messages) - len(copies)} duplicates reuse their prediction)")
+        
+        self.concurrency = _AdaptiveConcurrency(self.max_concurrent, latency_target=self.timeout / 2)
+        self.rate_limiter = _TokenBucket(self.target_rps, capacity=self.rate_burst)
+        
+        def record_result(message, result):
+            """Store one successful API response for every copy of the message."""
+            # Extract prediction and confidence from Chat Simulator API response
+            # The Chat Simulator API returns the full moderation result
+            moderation_result = result.get('result', {}).get('moderation_result', {})
+            
+            # Determine if message was flagged - use 'decision' field from API
+            decision = moderation_result.get('decision', 'Non-Toxic')
+            predicted_label = decision  # Direct mapping: "Toxic" or "Non-Toxic"
+            
+            # Extract confidence score
+            confidence = moderation_result.get('confidence', 0.5)
+            
+            # Extract processing time - convert from milliseconds to seconds
+            processing_time_ms = moderation_result.get('processing_time_ms', 0)
+            processing_time = processing_time_ms / 1000.0
+            
+            for i in copies[message]:
+                true_label = test_messages[i][1]
+                
+                # Write the sample straight into the preallocated arrays
+                self._y_true[self._n] = 1 if true_label == "Toxic" else 0
+                self._y_pred[self._n] = 1 if predicted_label == "Toxic" else 0
+                self._probs[self._n] = confidence  # Converted to P(Toxic) in one pass after collection
+                self._rt[self._n] = processing_time
+                self._n += 1
+                
+                # Keep only the scalars the metrics and report use; raw responses are opt-in
+                outcomes[i] = {
+                    'true_label': true_label,
+                    'predicted_label': predicted_label,
+                    'confidence': float(confidence),
+                    'response_time': float(processing_time),
+                    'action': moderation_result.get('action')
+                }
+                if self.keep_full_responses:
+                    outcomes[i]['message'] = message
+                    outcomes[i]['full_response'] = result
+        
+        def mark_failed(message, skipped=False):
+            """Count every copy of a message that could not be evaluated."""
+            nonlocal failed_requests, short_circuited
+            failed_requests += len(copies[message])
+            if skipped:
+                short_circuited += len(copies[message])
+        
+        def finish_samples(count):
+            """Report progress once samples are done."""
+            nonlocal completed
+            previous = completed
+            completed += count
+            
+            # Progress indicator
+            if completed // 10 > previous // 10:
+                print(f"✅ Processed {completed}/{len(copies)} messages")
+        
+        async def evaluate_group(client, group):
+            if self.batch_endpoint_available and self.breaker.allow_request():
+                async with self.concurrency:
+                    await self.rate_limiter.acquire()
+                    # Another group may have found the route missing while this one waited
+                    if self.batch_endpoint_available:
+                        items = await self._post_batch(client, group)
+                    else:
+                        items = None
+                
+                if items is not None:
+                    # Messages the server could not process get the per-message retry path
+                    retry = []
+                    for (i, (message, true_label)), item in zip(group, items):
+                        if item.get('status') == 'success':
+                            record_result(message, item)
+                        else:
+                            retry.append((i, (message, true_label)))
+                    finish_samples(len(group) - len(retry))
+                    group = retry
+            
+            await asyncio.gather(*[
+                evaluate_one(client, i, message, true_label)
+                for i, (message, true_label) in group
+            ])
+        
+        async def evaluate_one(client, i, message, true_label):
+            async with self.concurrency:
+                for attempt in range(1, self.max_retries + 1):
+                    # Fail fast without touching the network while the breaker is open
+                    if not self.breaker.allow_request():
+                        mark_failed(message, skipped=True)
+                        break
+                    
+                    await self.rate_limiter.acquire()
+                    start_time = time.perf_counter()
+                    try:
+                        # Send message to Chat Simulator API (proper entry point)
+                        response = await client.post(
+                            '/api/send-message',
+                            json={
+                                'message': message,
+                                'user_id': f'test_user_{i}',
+                                'username': f'TestUser{i}',
+                                'channel_id': 'evaluation_channel'
+                            }
+                        )
+                    except httpx.TimeoutException:
+                        self._record_failure()
+                        error = "timeout - server likely overloaded"
+                    except httpx.HTTPError as e:
+                        self._record_failure()
+                        error = f"connection error: {e}"
+                    else:
+                        if response.status_code >= 500 or response.status_code == 429:
+                            self._record_failure()
+                        else:
+                            self._record_success(time.perf_counter() - start_time)
+                        
+                        if response.status_code == 200:
+                            record_result(message, orjson.loads(response.content))
+                            break
+                        
+                        error = f"status {response.status_code}"
+                        if response.status_code not in RETRY_STATUSES:
+                            print(f"❌ Request failed ({error}), not retrying")
+                            mark_failed(message)
+                            break
+                    
+                    if attempt < self.max_retries:
+                        backoff_delay = self._backoff(attempt)
+                        print(f"⚠️  Request failed ({error}), backing off {backoff_delay:.1f}s... (attempt {attempt + 1}/{self.max_retries})")
+                        await asyncio.sleep(backoff_delay)
+                else:
+                    print(f"❌ Request failed after {self.max_retries} attempts ({error})")
+                    mark_failed(message)
+            
+            finish_samples(1)
+        
+        # Keep idle connections open across the request spacing and retry backoffs;
+        # httpx's 5s default expiry would otherwise reconnect before nearly every request
+        limits = httpx.Limits(
+            max_connections=self.max_concurrent,
+            max_keepalive_connections=self.max_concurrent,
+            keepalive_expiry=self.max_backoff + self.request_delay
+        )
+        indexed = ((indices[0], test_messages[indices[0]]) for indices in copies.values())
+        groups = iter(lambda: list(itertools.islice(indexed, self.batch_size)), [])
+        async with httpx.AsyncClient(base_url=self.base_url, limits=limits, timeout=self.timeout) as client:
+            await asyncio.gather(*[evaluate_group(client, group) for group in groups])
+        
+        return [outcome for outcome in outcomes if outcome is not None], failed_requests, short_circuited
+    
+    def _record_success(self, elapsed):
+        """Feed a request the server handled to the breaker and concurrency limit."""
+        self.breaker.record_success()
+        self.concurrency.record(True, elapsed)
+    
+    def _record_failure(self):
+        """Feed a timeout or server error to the breaker and concurrency limit."""
+        self.breaker.record_failure()
+        self.concurrency.record(False)
+    
+    def _backoff(self, attempt):
+        """Exponential backoff with jitter so concurrent retries do not line up."""
+        return min(self.max_backoff, self.request_delay * (2 ** (attempt - 1))) * random.uniform(0.5, 1.5)
+    
+    async def _post_batch(self, client, group):
+        """
+        Send a group of ``(index, (message, true_label))`` samples in one request.
+        
+        Returns:
+            list: One ``{"status": ..., "result": ...}`` item per message, or None
+                  if the batch request failed and the messages should be sent singly
+        """
+        start_time = time.perf_counter()
+        try:
+            response = await client.post(
+                '/api/send-messages-batch',
+                json={
+                    'channel_id': 'evaluation_channel',
+                    'messages': [
+                        {
+                            'message': message,
+                            'user_id': f'test_user_{i}',
+                            'username': f'TestUser{i}'
+                        }
+                        for i, (message, _) in group
+                    ]
+                }
+            )
+        except httpx.HTTPError:
+            self._record_failure()
+            return None
+        
+        if response.status_code == 404:
+            # The server still answered, which also settles a half-open breaker trial
+            self._record_success(time.perf_counter() - start_time)
+            if self.batch_endpoint_available:
+                print("⚠️  Batch endpoint not available, sending messages individually")
+            self.batch_endpoint_available = False
+            return None
+        if response.status_code >= 500 or response.status_code == 429:
+            self._record_failure()
+            return None
+        self._record_success(time.perf_counter() - start_time)
+        if response.status_code != 200:
+            return None
+        
+        items = orjson.loads(response.content).get('results', [])
+        return items if len(items) == len(group) else None
+    
     def calculate_performance_metrics(self):
         """
         Calculate comprehensive performance metrics for academic evaluation.
@@ -215,19 +604,24 @@ class ModelPerformanceEvaluator:
         Returns:
             dict: Comprehensive performance metrics
         """
-        if not self.ground_truth or not self.predictions:
+        if not self.y_true.size or not self.y_pred.size:
             print("❌ No evaluation data available. Run collect_evaluation_data() first.")
             return {}
         
-        # Convert labels to binary for sklearn
-        y_true_binary = [1 if label == "Toxic" else 0 for label in self.ground_truth]
-        y_pred_binary = [1 if label == "Toxic" else 0 for label in self.predictions]
+        # Visualizations and the report both ask for metrics; compute them once
+        if self._metrics_cache is not None:
+            return self._metrics_cache
         
-        # Basic metrics
-        accuracy = accuracy_score(y_true_binary, y_pred_binary)
-        precision = precision_score(y_true_binary, y_pred_binary, zero_division=0)
-        recall = recall_score(y_true_binary, y_pred_binary, zero_division=0)
-        f1 = f1_score(y_true_binary, y_pred_binary, zero_division=0)
+        # Labels are already stored as binary arrays for sklearn
+        y_true_binary = self.y_true
+        y_pred_binary = self.y_pred
+        
+        # Per-class precision/recall/F1/support in one pass; Toxic (1) is the positive class
+        p, r, f, support = precision_recall_fscore_support(
+            y_true_binary, y_pred_binary, labels=[0, 1], zero_division=0
+        )
+        accuracy = float((y_true_binary == y_pred_binary).mean())
+        precision, recall, f1 = p[1], r[1], f[1]
         
         # Confusion matrix
         cm = confusion_matrix(y_true_binary, y_pred_binary)
@@ -238,16 +632,23 @@ class ModelPerformanceEvaluator:
         except:
             roc_auc = None
         
-        # Classification report
-        class_report = classification_report(
-            y_true_binary, y_pred_binary, 
-            target_names=['Non-Toxic', 'Toxic'],
-            output_dict=True,
-            zero_division=0
-        )
+        # Classification report (same layout as sklearn's output_dict), built from the scores above
+        class_report = {
+            name: {'precision': p[k], 'recall': r[k], 'f1-score': f[k], 'support': int(support[k])}
+            for k, name in enumerate(['Non-Toxic', 'Toxic'])
+        }
+        class_report['accuracy'] = accuracy
+        class_report['macro avg'] = {
+            'precision': p.mean(), 'recall': r.mean(), 'f1-score': f.mean(), 'support': int(support.sum())
+        }
+        weights = support / support.sum()
+        class_report['weighted avg'] = {
+            'precision': p @ weights, 'recall': r @ weights, 'f1-score': f @ weights, 'support': int(support.sum())
+        }
         
         # Response time statistics
-        response_times = [r['response_time'] for r in self.evaluation_data.get('results', [])]
+        rt = self.response_times
+        toxic_samples = int(y_true_binary.sum())
         
         metrics = {
             'accuracy': accuracy,
@@ -258,42 +659,54 @@ class ModelPerformanceEvaluator:
             'confusion_matrix': cm,
             'classification_report': class_report,
             'response_time_stats': {
-                'mean': np.mean(response_times) if response_times else 0,
-                'median': np.median(response_times) if response_times else 0,
-                'std': np.std(response_times) if response_times else 0,
-                'min': np.min(response_times) if response_times else 0,
-                'max': np.max(response_times) if response_times else 0
+                'mean': float(rt.mean()) if rt.size else 0,
+                'median': float(np.median(rt)) if rt.size else 0,
+                'std': float(rt.std()) if rt.size else 0,
+                'min': float(rt.min()) if rt.size else 0,
+                'max': float(rt.max()) if rt.size else 0
             },
             'dataset_info': {
-                'total_samples': len(self.ground_truth),
-                'toxic_samples': sum(y_true_binary),
-                'non_toxic_samples': len(y_true_binary) - sum(y_true_binary),
+                'total_samples': len(y_true_binary),
+                'toxic_samples': toxic_samples,
+                'non_toxic_samples': len(y_true_binary) - toxic_samples,
                 'success_rate': self.evaluation_data.get('success_rate', 0)
             }
         }
         
+        self._metrics_cache = metrics
         return metrics
     
     def create_evaluation_visualizations(self, output_dir="reports"):
         """Create comprehensive evaluation visualizations using real data."""
+        # Plotting libraries are only imported when a dashboard is actually rendered
+        import matplotlib.pyplot as plt
+        import seaborn as sns
         
         metrics = self.calculate_performance_metrics()
         if not metrics:
             return None
         
-        # Create figure with subplots
-        fig = plt.figure(figsize=(20, 15))
+        # Panel data does not touch matplotlib; prepare it in worker threads (NumPy and
+        # sklearn release the GIL) while the figure is built, and collect it per panel
+        executor = ThreadPoolExecutor(max_workers=3)
+        if metrics['roc_auc'] is not None:
+            roc_future = executor.submit(roc_curve, self.y_true, self.prediction_probabilities)
+        rt_hist_future = executor.submit(np.histogram, self.response_times, bins=20)
+        conf_hist_future = executor.submit(np.histogram, self.prediction_probabilities, bins=20)
+        executor.shutdown(wait=False)
+        
+        # Create figure with all subplots in one call
+        fig, axes = plt.subplots(3, 3, figsize=(20, 15))
+        ax1, ax2, ax3, ax4, ax5, ax6, ax7, ax8, ax9 = axes.flat
         
         # 1. Confusion Matrix
-        ax1 = plt.subplot(3, 3, 1)
         sns.heatmap(metrics['confusion_matrix'], annot=True, fmt='d', cmap='Blues',
-                   xticklabels=['Non-Toxic', 'Toxic'], yticklabels=['Non-Toxic', 'Toxic'])
+                   xticklabels=['Non-Toxic', 'Toxic'], yticklabels=['Non-Toxic', 'Toxic'], ax=ax1)
         ax1.set_title('Confusion Matrix\n(Real Dataset)')
         ax1.set_ylabel('True Label')
         ax1.set_xlabel('Predicted Label')
         
         # 2. Performance Metrics Bar Chart
-        ax2 = plt.subplot(3, 3, 2)
         metrics_names = ['Accuracy', 'Precision', 'Recall', 'F1-Score']
         metrics_values = [metrics['accuracy'], metrics['precision'], metrics['recall'], metrics['f1_score']]
         bars = ax2.bar(metrics_names, metrics_values, color=['skyblue', 'lightgreen', 'lightcoral', 'gold'])
@@ -307,10 +720,8 @@ class ModelPerformanceEvaluator:
                     f'{value:.3f}', ha='center', va='bottom')
         
         # 3. ROC Curve (if available)
-        ax3 = plt.subplot(3, 3, 3)
         if metrics['roc_auc'] is not None:
-            y_true_binary = [1 if label == "Toxic" else 0 for label in self.ground_truth]
-            fpr, tpr, _ = roc_curve(y_true_binary, self.prediction_probabilities)
+            fpr, tpr, _ = roc_future.result()
             ax3.plot(fpr, tpr, color='darkorange', lw=2, 
                     label=f'ROC curve (AUC = {metrics["roc_auc"]:.3f})')
             ax3.plot([0, 1], [0, 1], color='navy', lw=2, linestyle='--')
@@ -324,11 +735,10 @@ class ModelPerformanceEvaluator:
             ax3.text(0.5, 0.5, 'ROC Curve\nNot Available', ha='center', va='center', transform=ax3.transAxes)
             ax3.set_title('ROC Curve\n(Real Dataset)')
         
-        # 4. Response Time Distribution
-        ax4 = plt.subplot(3, 3, 4)
-        response_times = [r['response_time'] for r in self.evaluation_data.get('results', [])]
-        if response_times:
-            ax4.hist(response_times, bins=20, alpha=0.7, color='lightblue', edgecolor='black')
+        # 4. Response Time Distribution (binned by NumPy, drawn as plain bars)
+        if self.response_times.size:
+            counts, edges = rt_hist_future.result()
+            ax4.bar(edges[:-1], counts, width=np.diff(edges), align='edge', alpha=0.7, color='lightblue', edgecolor='black')
             ax4.set_title(f'Response Time Distribution\nMean: {metrics["response_time_stats"]["mean"]:.2f}s')
             ax4.set_xlabel('Response Time (seconds)')
             ax4.set_ylabel('Frequency')
@@ -336,15 +746,14 @@ class ModelPerformanceEvaluator:
             ax4.text(0.5, 0.5, 'No Response Time\nData Available', ha='center', va='center', transform=ax4.transAxes)
         
         # 5. Class Distribution
-        ax5 = plt.subplot(3, 3, 5)
         class_counts = [metrics['dataset_info']['non_toxic_samples'], metrics['dataset_info']['toxic_samples']]
         ax5.pie(class_counts, labels=['Non-Toxic', 'Toxic'], autopct='%1.1f%%', colors=['lightgreen', 'lightcoral'])
         ax5.set_title('Dataset Class Distribution\n(Real Data)')
         
         # 6. Confidence Distribution
-        ax6 = plt.subplot(3, 3, 6)
-        if self.prediction_probabilities:
-            ax6.hist(self.prediction_probabilities, bins=20, alpha=0.7, color='gold', edgecolor='black')
+        if self.prediction_probabilities.size:
+            counts, edges = conf_hist_future.result()
+            ax6.bar(edges[:-1], counts, width=np.diff(edges), align='edge', alpha=0.7, color='gold', edgecolor='black')
             ax6.set_title('Prediction Confidence Distribution')
             ax6.set_xlabel('Confidence Score')
             ax6.set_ylabel('Frequency')
@@ -352,7 +761,6 @@ class ModelPerformanceEvaluator:
             ax6.text(0.5, 0.5, 'No Confidence\nData Available', ha='center', va='center', transform=ax6.transAxes)
         
         # 7. Success Rate
-        ax7 = plt.subplot(3, 3, 7)
         success_rate = metrics['dataset_info']['success_rate']
         ax7.bar(['Success Rate'], [success_rate], color='green' if success_rate > 0.9 else 'orange')
         ax7.set_title('Evaluation Success Rate')
@@ -361,7 +769,6 @@ class ModelPerformanceEvaluator:
         ax7.text(0, success_rate + 0.02, f'{success_rate:.1%}', ha='center', va='bottom')
         
         # 8. Per-Class Performance
-        ax8 = plt.subplot(3, 3, 8)
         class_metrics = ['precision', 'recall', 'f1-score']
         non_toxic_scores = [metrics['classification_report']['Non-Toxic'][m] for m in class_metrics]
         toxic_scores = [metrics['classification_report']['Toxic'][m] for m in class_metrics]
@@ -381,7 +788,6 @@ class ModelPerformanceEvaluator:
         ax8.set_ylim(0, 1)
         
         # 9. Dataset Information
-        ax9 = plt.subplot(3, 3, 9)
         ax9.axis('off')
         info_text = f"""Dataset Information:
         
@@ -402,16 +808,16 @@ Recall: {metrics['recall']:.3f}"""
         ax9.text(0.1, 0.9, info_text, transform=ax9.transAxes, fontsize=10,
                 verticalalignment='top', fontfamily='monospace')
         
-        plt.tight_layout()
-        plt.savefig(f'{output_dir}/model_evaluation_real.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(f'{output_dir}/model_evaluation_real.png', dpi=300, bbox_inches='tight')
+        plt.close(fig)
         
         return metrics
     
     def _format_confusion_matrix(self, cm):
         """Safely format confusion matrix for display."""
         try:
-            unique_labels = sorted(list(set(self.ground_truth)))
+            unique_labels = [['Non-Toxic', 'Toxic'][label] for label in np.unique(self.y_true)]
             if len(unique_labels) == cm.shape[0] == cm.shape[1]:
                 return pd.DataFrame(cm, index=unique_labels, columns=unique_labels).to_string()
             else:
@@ -430,94 +836,33 @@ Recall: {metrics['recall']:.3f}"""
         # Get dataset statistics
         dataset_stats = self.dataset_loader.get_dataset_statistics()
         
-        report = f"""# Model Performance Evaluation Report
-## Real Dataset Analysis - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-### Executive Summary
-This report presents a comprehensive evaluation of the real-time moderation system using the SetFit/toxic_conversations dataset. The evaluation employed a {'resource-friendly' if self.resource_friendly else 'standard'} approach to accommodate server constraints.
-
-### Dataset Information
-- **Source**: SetFit/toxic_conversations (Hugging Face)
-- **Total Dataset Size**: {dataset_stats['total_samples']:,} samples
-- **Evaluation Sample Size**: {metrics['dataset_info']['total_samples']} samples
-- **Class Distribution**:
-  - Toxic messages: {metrics['dataset_info']['toxic_samples']} ({metrics['dataset_info']['toxic_samples']/metrics['dataset_info']['total_samples']:.1%})
-  - Non-toxic messages: {metrics['dataset_info']['non_toxic_samples']} ({metrics['dataset_info']['non_toxic_samples']/metrics['dataset_info']['total_samples']:.1%})
-
-### Evaluation Configuration
-- **Resource-Friendly Mode**: {self.resource_friendly}
-- **Request Delay**: {self.request_delay}s
-- **Timeout**: {self.timeout}s
-- **Max Retries**: {self.max_retries}
-- **Success Rate**: {metrics['dataset_info']['success_rate']:.1%}
-
-### Performance Metrics
-
-#### Classification Performance
-- **Accuracy**: {metrics['accuracy']:.4f} ({metrics['accuracy']:.1%})
-- **Precision**: {metrics['precision']:.4f} ({metrics['precision']:.1%})
-- **Recall**: {metrics['recall']:.4f} ({metrics['recall']:.1%})
-- **F1-Score**: {metrics['f1_score']:.4f} ({metrics['f1_score']:.1%})
-{f"- **ROC AUC**: {metrics['roc_auc']:.4f}" if metrics['roc_auc'] else "- **ROC AUC**: Not available"}
-
-#### Response Time Analysis
-- **Mean Response Time**: {metrics['response_time_stats']['mean']:.3f} seconds
-- **Median Response Time**: {metrics['response_time_stats']['median']:.3f} seconds
-- **Standard Deviation**: {metrics['response_time_stats']['std']:.3f} seconds
-- **Min Response Time**: {metrics['response_time_stats']['min']:.3f} seconds
-- **Max Response Time**: {metrics['response_time_stats']['max']:.3f} seconds
-
-### Confusion Matrix Analysis
-The confusion matrix reveals the following classification patterns:
-{self._format_confusion_matrix(metrics['confusion_matrix'])}
-
-### Per-Class Performance Analysis
-
-#### Non-Toxic Class Performance
-- **Precision**: {metrics['classification_report']['Non-Toxic']['precision']:.4f}
-- **Recall**: {metrics['classification_report']['Non-Toxic']['recall']:.4f}
-- **F1-Score**: {metrics['classification_report']['Non-Toxic']['f1-score']:.4f}
-- **Support**: {metrics['classification_report']['Non-Toxic']['support']} samples
-
-#### Toxic Class Performance
-- **Precision**: {metrics['classification_report']['Toxic']['precision']:.4f}
-- **Recall**: {metrics['classification_report']['Toxic']['recall']:.4f}
-- **F1-Score**: {metrics['classification_report']['Toxic']['f1-score']:.4f}
-- **Support**: {metrics['classification_report']['Toxic']['support']} samples
-
-### Statistical Significance
-The evaluation was conducted using real-world data from the SetFit/toxic_conversations dataset, providing high external validity. The balanced sampling approach ensures representative evaluation across both classes.
-
-### Resource Management Analysis
-The {'resource-friendly' if self.resource_friendly else 'standard'} evaluation approach was employed:
-- **Request Success Rate**: {metrics['dataset_info']['success_rate']:.1%}
-- **Failed Requests**: {self.evaluation_data.get('failed_requests', 0)}
-- **Total Requests**: {self.evaluation_data.get('total_requests', 0)}
-
-### Recommendations
-
-#### Performance Optimization
-1. **Accuracy Improvement**: Current accuracy of {metrics['accuracy']:.1%} {'meets' if metrics['accuracy'] >= 0.85 else 'falls below'} typical production standards (85%+)
-2. **Precision-Recall Balance**: {'Well-balanced' if abs(metrics['precision'] - metrics['recall']) < 0.1 else 'Imbalanced'} precision ({metrics['precision']:.3f}) and recall ({metrics['recall']:.3f})
-3. **Response Time**: Average response time of {metrics['response_time_stats']['mean']:.2f}s {'is acceptable' if metrics['response_time_stats']['mean'] < 5.0 else 'may need optimization'} for real-time applications
-
-#### Resource Management
-1. **Server Optimization**: {'Resource-friendly approach successfully managed server constraints' if self.resource_friendly and metrics['dataset_info']['success_rate'] > 0.8 else 'Consider further resource optimization'}
-2. **Scaling Considerations**: Current configuration supports evaluation workloads with {metrics['dataset_info']['success_rate']:.1%} success rate
-
-### Conclusion
-The moderation system demonstrates {'strong' if metrics['f1_score'] >= 0.8 else 'moderate' if metrics['f1_score'] >= 0.6 else 'limited'} performance on real-world toxic conversation data. The evaluation using authentic labeled data provides high confidence in the results' applicability to production scenarios.
-
-### Technical Details
-- **Evaluation Date**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-- **Dataset Source**: SetFit/toxic_conversations
-- **Evaluation Framework**: Custom academic evaluation suite
-- **Statistical Methods**: Scikit-learn metrics with balanced sampling
-- **Visualization**: Comprehensive performance dashboard generated
-
----
-*This report was generated automatically by the Model Performance Evaluator using real labeled data for academic research purposes.*
-"""
+        # Every value the template needs, computed once; verdict wording is chosen here
+        info = metrics['dataset_info']
+        ctx = {
+            **metrics,
+            'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'mode': 'resource-friendly' if self.resource_friendly else 'standard',
+            'dataset_size': dataset_stats['total_samples'],
+            'toxic_share': info['toxic_samples'] / info['total_samples'],
+            'non_toxic_share': info['non_toxic_samples'] / info['total_samples'],
+            'resource_friendly': self.resource_friendly,
+            'request_delay': self.request_delay,
+            'timeout': self.timeout,
+            'max_retries': self.max_retries,
+            'roc_auc_text': f"{metrics['roc_auc']:.4f}" if metrics['roc_auc'] else "Not available",
+            'confusion_matrix_text': self._format_confusion_matrix(metrics['confusion_matrix']),
+            'failed_requests': self.evaluation_data.get('failed_requests', 0),
+            'total_requests': self.evaluation_data.get('total_requests', 0),
+            'accuracy_verdict': 'meets' if metrics['accuracy'] >= 0.85 else 'falls below',
+            'balance_verdict': 'Well-balanced' if abs(metrics['precision'] - metrics['recall']) < 0.1 else 'Imbalanced',
+            'latency_verdict': 'is acceptable' if metrics['response_time_stats']['mean'] < 5.0 else 'may need optimization',
+            'server_verdict': ('Resource-friendly approach successfully managed server constraints'
+                               if self.resource_friendly and info['success_rate'] > 0.8
+                               else 'Consider further resource optimization'),
+            'performance_verdict': ('strong' if metrics['f1_score'] >= 0.8
+                                    else 'moderate' if metrics['f1_score'] >= 0.6 else 'limited'),
+        }
+        report = _REPORT_TEMPLATE.format_map(ctx)
         
         # Save report
         with open(f'{output_dir}/model_evaluation_real_report.md', 'w') as f:
@@ -527,6 +872,31 @@ The moderation system demonstrates {'strong' if metrics['f1_score'] >= 0.8 else
         
         return metrics
 
+    def run_full_evaluation(self, use_full_dataset=True, sample_size=30, render=True, output_dir="reports"):
+        """
+        Collect data, compute metrics and write the report in one call.
+        
+        Args:
+            use_full_dataset (bool): If True, use entire dataset; if False, use balanced sample
+            sample_size (int): Number of samples to evaluate (only when use_full_dataset=False)
+            render (bool): Also render the dashboard; False skips matplotlib entirely
+            output_dir (str): Directory for the report and dashboard
+        
+        Returns:
+            dict: Comprehensive performance metrics
+        """
+        self.collect_evaluation_data(use_full_dataset=use_full_dataset, sample_size=sample_size)
+        
+        metrics = self.calculate_performance_metrics()
+        if not metrics:
+            return metrics
+        
+        if render:
+            self.create_evaluation_visualizations(output_dir)
+        
+        self.generate_academic_report(output_dir)
+        return metrics
+
 if __name__ == "__main__":
     # Example usage with real dataset
     print("🔬 Model Performance Evaluator - Real Dataset")
@@ -536,17 +906,8 @@ if __name__ == "__main__":
         # Initialize evaluator with resource-friendly mode
         evaluator = ModelPerformanceEvaluator(resource_friendly=True)
         
-        # Collect evaluation data using entire dataset
-        evaluator.collect_evaluation_data(use_full_dataset=True)
-        
-        # Calculate metrics
-        metrics = evaluator.calculate_performance_metrics()
-        
-        # Create visualizations
-        evaluator.create_evaluation_visualizations()
-        
-        # Generate report
-        evaluator.generate_academic_report()
+        # Collect evaluation data using entire dataset, then render and report
+        metrics = evaluator.run_full_evaluation(use_full_dataset=True)
         
         print("\n✅ Evaluation completed successfully!")
         print(f"📊 Key Results:")
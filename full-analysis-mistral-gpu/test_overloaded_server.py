@@ -9,11 +9,12 @@ Mistral-7B LLM server is overloaded with high GPU memory usage and request queue
 It implements ultra-conservative request patterns to avoid overwhelming the server further.
 """
 
-import requests
+import asyncio
+import httpx
 import json
+import random
 import time
 from datetime import datetime
-from dataset_loader import DissertationDatasetLoader
 
 class OverloadedServerTester:
     """
@@ -21,22 +22,69 @@ class OverloadedServerTester:
     """
     
     def __init__(self):
-        self.request_delay = 15.0      # 15 seconds between requests
+        self.request_delay = 15.0      # Initial spacing between requests
         self.timeout = 180.0           # 3 minute timeout
         self.max_retries = 2           # Only 2 retries to avoid pile-up
-        self.batch_delay = 60.0        # 1 minute between batches
-        self.health_check_interval = 5 # Check health every 5 requests
+        self.max_backoff = 120.0       # Upper bound for a single retry backoff
+        self.concurrency = 2           # Messages in flight at once
+        
+        # Adaptive (AIMD) pacing: speed up while the server keeps up,
+        # halve the rate as soon as it times out or returns errors
+        self.rate = 1.0 / self.request_delay  # Requests per second
+        self.min_rate = 1.0 / 60.0     # Never slower than 1 request per minute
+        self.max_rate = 1.0            # Never faster than 1 request per second
+        self.rtt_ewma = None           # Smoothed response time in seconds
+        self.last_request_time = None
+        self.rate_lock = None          # Created inside the running event loop
+        
+        # Sync client for health checks and recovery polling; message sends
+        # use their own AsyncClient in test_with_recovery(). Call close() when done.
+        self.base_url = 'http://localhost:8002'
+        self.client = httpx.Client(base_url=self.base_url, timeout=self.timeout)
         
         print("🚨 Overloaded Server Tester Initialized")
         print(f"   • Ultra-conservative settings for overloaded Mistral-7B")
-        print(f"   • Request delay: {self.request_delay}s")
+        print(f"   • Initial request delay: {self.request_delay}s (adaptive)")
         print(f"   • Timeout: {self.timeout}s")
         print(f"   • Max retries: {self.max_retries}")
+        print(f"   • Concurrent messages: {self.concurrency}")
+    
+    def close(self):
+        """Close the health-check client's pooled connections."""
+        self.client.close()
+    
+    def record_success(self, response_time):
+        """Increase the request rate after a response the server handled comfortably."""
+        if self.rtt_ewma is None:
+            self.rtt_ewma = response_time
+        else:
+            self.rtt_ewma = 0.8 * self.rtt_ewma + 0.2 * response_time
+        
+        if self.rtt_ewma < self.timeout / 2:
+            self.rate = min(self.max_rate, self.rate * 1.1)
+    
+    def record_failure(self):
+        """Halve the request rate when the server shows signs of overload."""
+        self.rate = max(self.min_rate, self.rate * 0.5)
+    
+    def next_backoff(self, previous_backoff):
+        """Decorrelated-jitter backoff so concurrent clients do not retry in lockstep."""
+        return min(self.max_backoff, random.uniform(self.request_delay, previous_backoff * 3))
+    
+    async def wait_for_rate_limit(self):
+        """Sleep only as long as needed to respect the current request rate."""
+        async with self.rate_lock:
+            if self.last_request_time is not None:
+                wait = 1.0 / self.rate - (time.monotonic() - self.last_request_time)
+                if wait > 0:
+                    print(f"⏸️  Pacing {wait:.1f}s before next request ({self.rate:.3f} req/s)...")
+                    await asyncio.sleep(wait)
+            self.last_request_time = time.monotonic()
     
     def check_server_health(self):
         """Check if the Chat Simulator is responsive."""
         try:
-            response = requests.get('http://localhost:8002/health', timeout=10.0)
+            response = self.client.get('/health', timeout=10.0)
             if response.status_code == 200:
                 print("✅ Chat Simulator health check passed")
                 return True
@@ -47,56 +95,74 @@ class OverloadedServerTester:
             print(f"❌ Chat Simulator health check error: {e}")
             return False
     
-    def wait_for_server_recovery(self, max_wait=300):
-        """Wait for server to recover from overload."""
+    def wait_for_server_recovery(self, max_wait=300, max_poll_delay=30.0):
+        """Wait for server to recover from overload.
+        
+        Polls quickly at first to catch short outages, then ramps the
+        interval up by 1.5x (with jitter) towards ``max_poll_delay``.
+        """
         print("⏳ Waiting for server recovery...")
-        start_time = time.time()
+        start_time = time.perf_counter()
+        poll_delay = 1.0
         
-        while time.time() - start_time < max_wait:
+        while time.perf_counter() - start_time < max_wait:
             if self.check_server_health():
-                recovery_time = time.time() - start_time
+                recovery_time = time.perf_counter() - start_time
                 print(f"✅ Server recovered after {recovery_time:.1f} seconds")
                 return True
             
-            print("⏸️  Server still overloaded, waiting 30s...")
-            time.sleep(30.0)
+            remaining = max_wait - (time.perf_counter() - start_time)
+            delay = min(remaining, poll_delay * random.uniform(0.9, 1.1))
+            if delay <= 0:
+                break
+            print(f"⏸️  Server still overloaded, waiting {delay:.1f}s...")
+            time.sleep(delay)
+            poll_delay = min(max_poll_delay, poll_delay * 1.5)
         
         print(f"❌ Server did not recover within {max_wait} seconds")
         return False
     
-    def send_single_message(self, message, user_id, attempt=1):
+    async def send_single_message(self, client, message, user_id, attempt=1):
         """Send a single message with ultra-conservative approach."""
         print(f"📤 Sending message (attempt {attempt}): {message[:50]}...")
         
+        start_time = time.monotonic()
         try:
-            response = requests.post(
-                'http://localhost:8002/api/send-message',
+            response = await client.post(
+                '/api/send-message',
                 json={
                     'message': message,
                     'user_id': user_id,
                     'username': f'TestUser{user_id}',
                     'channel_id': 'overload_test'
-                },
-                timeout=self.timeout
+                }
             )
             
             if response.status_code == 200:
                 result = response.json()
+                self.record_success(time.monotonic() - start_time)
                 print(f"✅ Message processed successfully")
                 return result
             else:
+                self.record_failure()
                 print(f"⚠️  Request failed with status: {response.status_code}")
                 return None
                 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
+            self.record_failure()
             print(f"⏰ Request timed out after {self.timeout}s - server likely overloaded")
             return None
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
+            self.record_failure()
             print(f"🔌 Connection error: {e}")
             return None
     
-    def test_with_recovery(self, messages, max_messages=5):
-        """Test messages with automatic recovery handling."""
+    async def test_with_recovery(self, messages, max_messages=5):
+        """Test messages with automatic recovery handling.
+        
+        Up to ``self.concurrency`` messages are in flight at once; every
+        request still goes through the shared adaptive rate limit.
+        """
         print(f"🧪 Testing {min(len(messages), max_messages)} messages with recovery handling")
         
         results = []
@@ -106,50 +172,61 @@ class OverloadedServerTester:
         # Limit to small number for overloaded server
         test_messages = messages[:max_messages]
         
-        for i, (message, true_label) in enumerate(test_messages):
-            print(f"\n--- Message {i+1}/{len(test_messages)} ---")
+        self.rate_lock = asyncio.Lock()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        stop = asyncio.Event()
+        
+        async def worker(client, i, message, true_label):
+            nonlocal successful, failed
             
-            # Health check every few requests
-            if i % self.health_check_interval == 0 and i > 0:
-                if not self.check_server_health():
-                    print("🚨 Server appears overloaded, waiting for recovery...")
-                    if not self.wait_for_server_recovery():
-                        print("❌ Stopping test due to server overload")
+            async with semaphore:
+                if stop.is_set():
+                    return
+                
+                print(f"\n--- Message {i+1}/{len(test_messages)} ---")
+                
+                # Attempt to send message
+                result = None
+                backoff_delay = self.request_delay
+                for attempt in range(1, self.max_retries + 1):
+                    await self.wait_for_rate_limit()
+                    result = await self.send_single_message(client, message, f"test_{i}", attempt)
+                    
+                    if result is not None:
+                        successful += 1
+                        results.append({
+                            'index': i,
+                            'message': message,
+                            'true_label': true_label,
+                            'result': result,
+                            'attempt': attempt
+                        })
                         break
-            
-            # Attempt to send message
-            result = None
-            for attempt in range(1, self.max_retries + 1):
-                result = self.send_single_message(message, f"test_{i}", attempt)
+                    else:
+                        if attempt < self.max_retries:
+                            backoff_delay = self.next_backoff(backoff_delay)
+                            print(f"⏸️  Backing off {backoff_delay:.1f}s before retry...")
+                            await asyncio.sleep(backoff_delay)
                 
-                if result is not None:
-                    successful += 1
-                    results.append({
-                        'message': message,
-                        'true_label': true_label,
-                        'result': result,
-                        'attempt': attempt
-                    })
-                    break
-                else:
-                    if attempt < self.max_retries:
-                        backoff_delay = self.request_delay * (2 ** attempt)
-                        print(f"⏸️  Backing off {backoff_delay:.1f}s before retry...")
-                        time.sleep(backoff_delay)
-            
-            if result is None:
-                failed += 1
-                print(f"❌ Message failed after {self.max_retries} attempts")
-            
-            # Long delay between messages to avoid overloading
-            if i < len(test_messages) - 1:
-                print(f"⏸️  Waiting {self.request_delay}s before next message...")
-                time.sleep(self.request_delay)
-            
-            # Extra long delay every few messages
-            if (i + 1) % 3 == 0 and i < len(test_messages) - 1:
-                print(f"⏸️  Extended batch delay ({self.batch_delay}s) for server recovery...")
-                time.sleep(self.batch_delay)
+                if result is None:
+                    failed += 1
+                    print(f"❌ Message failed after {self.max_retries} attempts")
+                    
+                    # Only probe health once requests actually fail
+                    if not stop.is_set() and not await asyncio.to_thread(self.check_server_health):
+                        print("🚨 Server appears overloaded, waiting for recovery...")
+                        if not await asyncio.to_thread(self.wait_for_server_recovery):
+                            print("❌ Stopping test due to server overload")
+                            stop.set()
+        
+        limits = httpx.Limits(max_connections=self.concurrency)
+        async with httpx.AsyncClient(http2=True, base_url=self.base_url, timeout=self.timeout, limits=limits) as client:
+            await asyncio.gather(*[
+                worker(client, i, message, true_label)
+                for i, (message, true_label) in enumerate(test_messages)
+            ])
+        
+        results.sort(key=lambda r: r['index'])
         
         # Summary
         print(f"\n📊 Test Summary:")
@@ -169,13 +246,16 @@ def main():
     print("• Frequent request aborts")
     print("=" * 50)
     
+    tester = None
     try:
         # Initialize tester
         tester = OverloadedServerTester()
         
-        # Load a very small dataset sample
+        # Load a very small dataset sample (imported here so pandas is only
+        # loaded once the tester is actually about to run)
+        from dataset_loader import DissertationDatasetLoader
         loader = DissertationDatasetLoader()
-        messages = loader.get_balanced_sample(n_samples=6, random_state=42)  # Very small sample
+        messages = loader.get_balanced_sample_cached(n_samples=6, random_state=42)  # Very small sample
         
         print(f"\n📋 Loaded {len(messages)} test messages")
         
@@ -184,7 +264,7 @@ def main():
             print("⚠️  Server appears to be having issues, but proceeding with ultra-conservative test...")
         
         # Run test with recovery
-        results = tester.test_with_recovery(messages, max_messages=3)  # Only test 3 messages
+        results = asyncio.run(tester.test_with_recovery(messages, max_messages=3))  # Only test 3 messages
         
         if results:
             print(f"\n✅ Test completed with {len(results)} successful results")
@@ -208,6 +288,10 @@ def main():
         print("1. Check if Chat Simulator is running: curl http://localhost:8002/health")
         print("2. Check Mistral-7B logs for overload indicators")
         print("3. Monitor GPU memory usage on Kubernetes cluster")
+    
+    finally:
+        if tester is not None:
+            tester.close()
 
 if __name__ == "__main__":
     main()
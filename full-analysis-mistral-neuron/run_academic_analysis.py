@@ -13,233 +13,88 @@ This script runs the complete academic analysis pipeline including:
 import os
 import sys
 import argparse
+import asyncio
+import functools
+import logging
+import mmap
 import shutil
+import string
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-
-# Add analysis modules to path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from statistical_analysis import ModerationSystemAnalyzer
-from experimental_design import ExperimentalDesign
-from dataset_loader import DissertationDatasetLoader
-
-def setup_analysis_environment():
-    """Setup the analysis environment and directories."""
-    
-    print("🔧 Setting up academic analysis environment...")
-    
-    # Create necessary directories
-    directories = [
-        "analysis/reports",
-        "analysis/data",
-        "analysis/figures",
-        "analysis/exports"
-    ]
-    
-    for directory in directories:
-        os.makedirs(directory, exist_ok=True)
-        print(f"✅ Created directory: {directory}")
-    
-    print("✅ Analysis environment ready")
-
-def run_statistical_analysis():
-    """Run comprehensive statistical analysis."""
-    
-    print("\n" + "="*60)
-    print("📊 STATISTICAL ANALYSIS")
-    print("="*60)
-    
-    analyzer = ModerationSystemAnalyzer()
-    
-    # Generate comprehensive performance report
-    analyzer.generate_performance_report("analysis/reports")
-    
-    return analyzer
-
-def run_model_evaluation():
-    """Run comprehensive model evaluation using real dataset or reuse existing results."""
-    
-    print("\n" + "="*60)
-    print("🤖 MODEL EVALUATION")
-    print("="*60)
-    
-    # Check if model_evaluation_real.py results already exist
-    real_report_path = "reports/model_evaluation_real_report.md"
-    real_viz_path = "reports/model_evaluation_real.png"
-    
-    if os.path.exists(real_report_path) and os.path.exists(real_viz_path):
-        print("✅ Found existing model evaluation results from model_evaluation_real.py")
-        print(f"   • Report: {real_report_path}")
-        print(f"   • Visualization: {real_viz_path}")
-        
-        # Copy/link the real evaluation results to the expected academic analysis locations
-        academic_report_path = "analysis/reports/model_evaluation_report.md"
-        academic_viz_path = "analysis/reports/model_evaluation.png"
-        
-        try:
-            # Copy the real evaluation report to academic analysis location
-            if os.path.exists(real_report_path):
-                import shutil
-                shutil.copy2(real_report_path, academic_report_path)
-                print(f"📋 Copied evaluation report to: {academic_report_path}")
-            
-            # Copy the real evaluation visualization to academic analysis location
-            if os.path.exists(real_viz_path):
-                shutil.copy2(real_viz_path, academic_viz_path)
-                print(f"📊 Copied evaluation visualization to: {academic_viz_path}")
-            
-            # Extract metrics from the existing report for return value
-            metrics = extract_metrics_from_report(real_report_path)
-            
-            print("🔄 Reusing existing model evaluation results (no duplication)")
-            return None, metrics
-            
-        except Exception as e:
-            print(f"⚠️  Error copying existing results: {e}")
-            print("📝 Falling back to new evaluation...")
-    
-    else:
-        print("⚠️  No existing model evaluation results found")
-        print("💡 Run model_evaluation_real.py first to avoid duplication")
-        print("📝 Proceeding with new evaluation...")
-    
-    # Fallback: Import and use the real evaluation system
-    try:
-        from model_evaluation_real import ModelPerformanceEvaluator
-        
-        evaluator = ModelPerformanceEvaluator(resource_friendly=True)
-        
-        # Load real dataset
-        print("📊 Loading real dataset from dissertation-experiment-data.csv...")
-        dataset_loader = DissertationDatasetLoader("dissertation-experiment-data.csv")
-        real_dataset = dataset_loader.get_full_dataset()
-        print(f"✅ Loaded {len(real_dataset)} messages from real dataset")
-        
-        # Collect evaluation data with real dataset
-        print("📝 Collecting evaluation data using entire real dataset...")
-        evaluation_data = evaluator.collect_evaluation_data(test_messages=real_dataset)
-        
-        if evaluation_data and len(evaluation_data.get('results', [])) > 0:
-            # Create evaluation visualizations
-            print("📊 Creating evaluation visualizations...")
-            metrics = evaluator.create_evaluation_visualizations("analysis/reports")
-            
-            # Generate academic report
-            print("📋 Generating academic evaluation report...")
-            evaluator.generate_academic_report("analysis/reports")
-            
-            return evaluator, metrics
-        else:
-            print("⚠️  No evaluation data collected")
-            return None, {}
-            
-    except ImportError as e:
-        print(f"❌ Could not import model_evaluation_real: {e}")
-        return None, {}
-    except Exception as e:
-        print(f"❌ Error in model evaluation: {e}")
-        return None, {}
-
-def extract_metrics_from_report(report_path):
-    """Extract metrics from existing model evaluation report."""
-    metrics = {}
-    
-    try:
-        with open(report_path, 'r') as f:
-            content = f.read()
-        
-        import re
-        
-        # Extract key metrics using regex
-        accuracy_match = re.search(r'Accuracy:\*\* ([\d.]+)', content)
-        if accuracy_match:
-            metrics['accuracy'] = float(accuracy_match.group(1))
-        
-        precision_match = re.search(r'Precision:\*\* ([\d.]+)', content)
-        if precision_match:
-            metrics['precision'] = float(precision_match.group(1))
-        
-        recall_match = re.search(r'Recall:\*\* ([\d.]+)', content)
-        if recall_match:
-            metrics['recall'] = float(recall_match.group(1))
-        
-        f1_match = re.search(r'F1-Score:\*\* ([\d.]+)', content)
-        if f1_match:
-            metrics['f1_score'] = float(f1_match.group(1))
-        
-        sample_match = re.search(r'Sample Size:\*\* (\d+)', content)
-        if sample_match:
-            metrics['sample_size'] = int(sample_match.group(1))
-        
-        print(f"📊 Extracted metrics from existing report: {len(metrics)} parameters")
-        
-    except Exception as e:
-        print(f"⚠️  Error extracting metrics from report: {e}")
-        metrics = {'accuracy': 1.0, 'precision': 1.0, 'recall': 1.0, 'f1_score': 1.0, 'sample_size': 60}
-    
-    return metrics
-
-def run_experimental_analysis():
-    """Run experimental design and analysis."""
-    
-    print("\n" + "="*60)
-    print("🧪 EXPERIMENTAL ANALYSIS")
-    print("="*60)
-    
-    designer = ExperimentalDesign()
-    
-    # Design performance experiment
-    print("🔬 Designing performance experiment...")
-    experiment = designer.design_controlled_experiment(
-        "System_Performance_Analysis",
-        {
-            "batch_sizes": [1, 2, 3, 4, 5, 6, 7],
-            "message_types": ["toxic", "non_toxic", "mixed"],
-            "load_levels": ["low", "medium", "high"]
-        }
+from pathlib import Path
+from typing import NamedTuple
+
+# Add analysis modules to path, unless the script directory is already on it
+# (running the file directly or via run_all_analysis.py puts it there)
+_HERE = os.path.dirname(os.path.abspath(__file__))
+if _HERE not in sys.path:
+    sys.path.append(_HERE)
+
+logger = logging.getLogger(__name__)
+
+# Section rule used by every stage heading
+_BANNER = "=" * 60
+
+# Output directories, created once per process by setup_analysis_environment()
+_ANALYSIS_ROOT = Path("analysis")
+_DIRS = tuple(_ANALYSIS_ROOT / name for name in ("reports", "data", "figures", "exports"))
+_ENV_READY = False
+
+class ExperimentParams(NamedTuple):
+    """Conditions of the controlled performance experiment."""
+    batch_sizes: tuple
+    message_types: tuple
+    load_levels: tuple
+
+_EXPERIMENT_PARAMS = ExperimentParams(
+    batch_sizes=tuple(range(1, 8)),
+    message_types=("toxic", "non_toxic", "mixed"),
+    load_levels=("low", "medium", "high"),
+)
+
+# Line prefixes of the headline metrics in the model evaluation report. Both
+# the current "- **Accuracy**: 0.78" layout and the older "- **Accuracy:** 0.78"
+# one are recognised; the first occurrence of each metric wins. Prefixes are
+# bytes so the memory-mapped report is matched without decoding it.
+_METRIC_PREFIXES = tuple(
+    (prefix.encode("utf-8"), key, convert)
+    for label, key, convert in (
+        ('Accuracy', 'accuracy', float),
+        ('Precision', 'precision', float),
+        ('Recall', 'recall', float),
+        ('F1-Score', 'f1_score', float),
+        ('Evaluation Sample Size', 'sample_size', int),
+        ('Sample Size', 'sample_size', int),
     )
-    
-    # Generate experimental dataset
-    print("📊 Generating experimental dataset...")
-    dataset = designer.generate_experimental_dataset(size=30, toxicity_rate=0.35)
-    
-    # Run performance experiment
-    print("🚀 Running performance experiment...")
-    results = designer.run_performance_experiment(
-        "System_Performance_Analysis", 
-        dataset, 
-        batch_sizes=[1, 2, 3, 4, 5, 6, 7]
-    )
-    
-    # Analyze results
-    print("📈 Analyzing experimental results...")
-    analysis = designer.analyze_experiment_results("System_Performance_Analysis")
-    
-    # Create visualizations
-    print("📊 Creating experimental visualizations...")
-    designer.create_experiment_visualizations("System_Performance_Analysis", "analysis/reports")
-    
-    return designer, analysis
-
-def generate_comprehensive_report():
-    """Generate comprehensive academic dissertation report."""
-    
-    print("\n" + "="*60)
-    print("📋 COMPREHENSIVE ACADEMIC REPORT")
-    print("="*60)
-    
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    report = f"""
+    for prefix in (f'- **{label}**: ', f'- **{label}:** ')
+)
+
+# Closing summary printed by main() in a single write
+_OUTPUTS_BANNER = "\n".join((
+    "📊 Key outputs:",
+    "   - Statistical Analysis: statistical_summary.md",
+    "   - Model Evaluation: model_evaluation_report.md",
+    "   - Experimental Results: experiment_*.png",
+    "   - Comprehensive Report: comprehensive_academic_report.md",
+    "   - Visualizations: *_analysis.png",
+    "",
+    "🎓 Ready for academic dissertation use!",
+))
+
+# Comprehensive report, split so only the timestamped header and footer are
+# rendered per run; the static body is encoded once at import
+_REPORT_HEADER = string.Template("""
 # Quantitative Analysis of Real-Time Content Moderation Systems
 ## Academic Dissertation Research Report
 
-**Generated:** {timestamp}  
+**Generated:** $timestamp  
 **Research Framework:** Statistical Analysis and Experimental Evaluation  
 **System Under Study:** Real-Time Moderation System with LLM Integration
 
 ---
+""")
 
+_REPORT_BODY = """
 ## Abstract
 
 This comprehensive report presents a quantitative analysis of a real-time content moderation 
@@ -402,33 +257,351 @@ evidence-based and suitable for academic publication and practical implementatio
 dissertation research. All statistical methods follow established academic standards 
 and provide appropriate confidence intervals and significance testing.
 
-**Generated by:** Academic Analysis Framework  
+""".encode("utf-8")
+
+_REPORT_FOOTER = string.Template("""**Generated by:** Academic Analysis Framework  
 **System:** Real-Time Moderation System  
-**Analysis Date:** {timestamp}
-"""
+**Analysis Date:** $timestamp
+""")
+
+def configure_logging(level=logging.INFO):
+    """Print the runner's status messages to stdout; also used as the worker initializer.
+    
+    Only this module's logger is configured, so libraries such as httpx keep
+    their per-request INFO logging switched off.
+    """
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.propagate = False
+    logger.setLevel(level)
+
+def setup_analysis_environment():
+    """Setup the analysis environment and directories."""
     
-    # Save comprehensive report
-    with open("analysis/reports/comprehensive_academic_report.md", "w") as f:
-        f.write(report)
+    global _ENV_READY
+    if _ENV_READY:
+        return
     
-    print("📋 Comprehensive academic report generated: analysis/reports/comprehensive_academic_report.md")
+    logger.info("🔧 Setting up academic analysis environment...")
+    
+    # One directory read tells us which subdirectories already exist
+    try:
+        with os.scandir(_ANALYSIS_ROOT) as entries:
+            existing = {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        _ANALYSIS_ROOT.mkdir(parents=True, exist_ok=True)
+        existing = set()
+    
+    # The parent now exists, so only the missing leaves need a single mkdir each
+    created = []
+    for directory in _DIRS:
+        if directory.name not in existing:
+            directory.mkdir(exist_ok=True)
+            created.append(f"✅ Created directory: {directory}")
+    
+    created.append("✅ Analysis environment ready")
+    logger.info("\n".join(created))
+    _ENV_READY = True
 
-def main():
-    """Main execution function."""
+def run_statistical_analysis():
+    """Run comprehensive statistical analysis.
+    
+    Returns the analyzer's results dict rather than the analyzer itself, since
+    the stage runs in a worker process and its return value must be picklable.
+    """
+    
+    logger.info("\n" + _BANNER)
+    logger.info("📊 STATISTICAL ANALYSIS")
+    logger.info(_BANNER)
+    
+    from statistical_analysis import ModerationSystemAnalyzer
+    
+    analyzer = ModerationSystemAnalyzer()
     
+    # Generate comprehensive performance report
+    analyzer.generate_performance_report("analysis/reports")
+    
+    return analyzer.results
+
+def _link_or_copy(src, dst):
+    """Hardlink ``src`` to ``dst``, falling back to a content copy.
+    
+    The academic copies only mirror the model_evaluation_real.py output, so a
+    link gives the same result without moving any bytes. Where links are not
+    possible (another filesystem, no link support) the contents are copied
+    with copyfile, which uses sendfile on Linux and skips the metadata.
+    """
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+def run_model_evaluation():
+    """Run comprehensive model evaluation using real dataset or reuse existing results.
+    
+    Returns only the metrics dict; the evaluator holds asyncio state that cannot
+    be pickled back from the worker process.
+    """
+    
+    logger.info("\n" + _BANNER)
+    logger.info("🤖 MODEL EVALUATION")
+    logger.info(_BANNER)
+    
+    # Check if model_evaluation_real.py results already exist
+    real_report_path = "reports/model_evaluation_real_report.md"
+    real_viz_path = "reports/model_evaluation_real.png"
+    report_exists = os.path.exists(real_report_path)
+    viz_exists = os.path.exists(real_viz_path)
+    
+    if report_exists and viz_exists:
+        logger.info("✅ Found existing model evaluation results from model_evaluation_real.py")
+        logger.info(f"   • Report: {real_report_path}")
+        logger.info(f"   • Visualization: {real_viz_path}")
+        
+        # Copy/link the real evaluation results to the expected academic analysis locations
+        academic_report_path = "analysis/reports/model_evaluation_report.md"
+        academic_viz_path = "analysis/reports/model_evaluation.png"
+        
+        try:
+            # Copy the real evaluation report to academic analysis location
+            _link_or_copy(real_report_path, academic_report_path)
+            logger.info(f"📋 Copied evaluation report to: {academic_report_path}")
+            
+            # Copy the real evaluation visualization to academic analysis location
+            _link_or_copy(real_viz_path, academic_viz_path)
+            logger.info(f"📊 Copied evaluation visualization to: {academic_viz_path}")
+            
+            # Extract metrics from the existing report for return value
+            metrics = extract_metrics_from_report(real_report_path)
+            
+            logger.info("🔄 Reusing existing model evaluation results (no duplication)")
+            return metrics
+            
+        except Exception as e:
+            logger.warning(f"⚠️  Error copying existing results: {e}")
+            logger.info("📝 Falling back to new evaluation...")
+    
+    else:
+        logger.warning("⚠️  No existing model evaluation results found")
+        logger.info("💡 Run model_evaluation_real.py first to avoid duplication")
+        logger.info("📝 Proceeding with new evaluation...")
+    
+    # Fallback: Import and use the real evaluation system
+    try:
+        from model_evaluation_real import ModelPerformanceEvaluator
+        from dataset_loader import DissertationDatasetLoader
+        
+        evaluator = ModelPerformanceEvaluator(resource_friendly=True)
+        
+        # Load real dataset
+        logger.info("📊 Loading real dataset from dissertation-experiment-data.csv...")
+        dataset_loader = DissertationDatasetLoader("dissertation-experiment-data.csv")
+        real_dataset = dataset_loader.get_full_dataset()
+        logger.info(f"✅ Loaded {len(real_dataset)} messages from real dataset")
+        
+        # Collect evaluation data with real dataset
+        logger.info("📝 Collecting evaluation data using entire real dataset...")
+        evaluation_data = evaluator.collect_evaluation_data(test_messages=real_dataset)
+        
+        if evaluation_data and len(evaluation_data.get('results', [])) > 0:
+            # Create evaluation visualizations
+            logger.info("📊 Creating evaluation visualizations...")
+            metrics = evaluator.create_evaluation_visualizations("analysis/reports")
+            
+            # Generate academic report
+            logger.info("📋 Generating academic evaluation report...")
+            evaluator.generate_academic_report("analysis/reports")
+            
+            return metrics
+        else:
+            logger.warning("⚠️  No evaluation data collected")
+            return {}
+            
+    except ImportError as e:
+        logger.error(f"❌ Could not import model_evaluation_real: {e}")
+        return {}
+    except Exception as e:
+        logger.error(f"❌ Error in model evaluation: {e}")
+        return {}
+
+def _parse_metric_lines(lines):
+    """Collect the headline metrics from report lines in one prefix-matching pass."""
+    metrics = {}
+    for line in lines:
+        line = line.lstrip()
+        if not line.startswith(b'- **'):
+            continue
+        
+        for prefix, key, convert in _METRIC_PREFIXES:
+            if key not in metrics and line.startswith(prefix):
+                value = line[len(prefix):].split(maxsplit=1)
+                try:
+                    metrics[key] = convert(value[0])
+                except (IndexError, ValueError):
+                    pass
+                break
+    
+    return metrics
+
+def extract_metrics_from_report(report_path):
+    """Extract metrics from existing model evaluation report."""
+    metrics = {}
+    
+    try:
+        # The kernel pages the report in on demand; only matched values are parsed
+        with open(report_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    metrics = _parse_metric_lines(iter(mm.readline, b''))
+        
+        logger.info(f"📊 Extracted metrics from existing report: {len(metrics)} parameters")
+        
+    except Exception as e:
+        logger.warning(f"⚠️  Error extracting metrics from report: {e}")
+        metrics = {'accuracy': 1.0, 'precision': 1.0, 'recall': 1.0, 'f1_score': 1.0, 'sample_size': 60}
+    
+    return metrics
+
+def run_experimental_analysis():
+    """Run experimental design and analysis.
+    
+    Returns the analysis dict rather than the designer, so the result can be
+    pickled back from the worker process.
+    """
+    
+    logger.info("\n" + _BANNER)
+    logger.info("🧪 EXPERIMENTAL ANALYSIS")
+    logger.info(_BANNER)
+    
+    import numpy as np
+    from experimental_design import ExperimentalDesign
+    
+    # Typed copy of the batch sizes for the experiment run
+    batch_sizes = np.asarray(_EXPERIMENT_PARAMS.batch_sizes, dtype=np.int64)
+    
+    designer = ExperimentalDesign()
+    
+    # Design performance experiment
+    logger.info("🔬 Designing performance experiment...")
+    experiment = designer.design_controlled_experiment(
+        "System_Performance_Analysis",
+        _EXPERIMENT_PARAMS._asdict()
+    )
+    
+    # Generate experimental dataset
+    logger.info("📊 Generating experimental dataset...")
+    dataset = designer.generate_experimental_dataset(size=30, toxicity_rate=0.35)
+    
+    # Run performance experiment
+    logger.info("🚀 Running performance experiment...")
+    results = designer.run_performance_experiment(
+        "System_Performance_Analysis", 
+        dataset, 
+        batch_sizes=batch_sizes
+    )
+    
+    # Analyze results
+    logger.info("📈 Analyzing experimental results...")
+    analysis = designer.analyze_experiment_results("System_Performance_Analysis")
+    
+    # Create visualizations
+    logger.info("📊 Creating experimental visualizations...")
+    designer.create_experiment_visualizations("System_Performance_Analysis", "analysis/reports")
+    
+    return analysis
+
+@functools.lru_cache(maxsize=8)
+def render_comprehensive_report(timestamp):
+    """Render the comprehensive report for ``timestamp`` as a tuple of UTF-8 buffers."""
+    return (
+        _REPORT_HEADER.substitute(timestamp=timestamp).encode("utf-8"),
+        _REPORT_BODY,
+        _REPORT_FOOTER.substitute(timestamp=timestamp).encode("utf-8"),
+    )
+
+def generate_comprehensive_report(timestamp):
+    """Generate comprehensive academic dissertation report stamped with ``timestamp``."""
+    
+    logger.info("\n" + _BANNER)
+    logger.info("📋 COMPREHENSIVE ACADEMIC REPORT")
+    logger.info(_BANNER)
+    
+    # Save comprehensive report: stream each rendered section straight to
+    # write(2) rather than joining them into one report string first
+    fd = os.open("analysis/reports/comprehensive_academic_report.md",
+                 os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        for data in map(memoryview, render_comprehensive_report(timestamp)):
+            while data:
+                data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+    
+    logger.info("📋 Comprehensive academic report generated: analysis/reports/comprehensive_academic_report.md")
+
+async def _run_stages(stages, log_level):
+    """Run the selected stages in worker processes and write the report meanwhile.
+    
+    The stages write disjoint report files and share no state, so each one
+    runs in its own process and imports only what it needs. The comprehensive
+    report does not depend on their results, so its file write overlaps with
+    them on a thread instead of waiting for the slowest stage.
+    
+    A failing stage is logged and left out of the returned results, so the
+    stages that succeeded are still reported.
+    """
+    loop = asyncio.get_running_loop()
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    with ProcessPoolExecutor(max_workers=3, initializer=configure_logging,
+                             initargs=(log_level,)) as executor:
+        tasks = [loop.run_in_executor(executor, stage) for stage in stages.values()]
+        report = asyncio.to_thread(generate_comprehensive_report, timestamp)
+        *outcomes, report_error = await asyncio.gather(*tasks, report, return_exceptions=True)
+    
+    if isinstance(report_error, BaseException):
+        logger.error(f"❌ Error generating comprehensive report: {report_error}")
+    
+    results = {}
+    for name, outcome in zip(stages, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error(f"❌ {name.capitalize()} stage failed: {outcome!r}")
+        else:
+            results[name] = outcome
+    
+    return results
+
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """Build the command-line parser once; it is never mutated after construction."""
     parser = argparse.ArgumentParser(description="Academic Analysis Runner for Moderation System")
     parser.add_argument("--skip-setup", action="store_true", help="Skip environment setup")
     parser.add_argument("--analysis-only", action="store_true", help="Run statistical analysis only")
     parser.add_argument("--evaluation-only", action="store_true", help="Run model evaluation only")
     parser.add_argument("--experiment-only", action="store_true", help="Run experimental analysis only")
     parser.add_argument("--output-dir", default="analysis/reports", help="Output directory for reports")
+    parser.add_argument("--quiet", action="store_true", help="Only report warnings and errors")
+    return parser
+
+def main():
+    """Main execution function."""
     
-    args = parser.parse_args()
+    args = _build_parser().parse_args()
     
-    print("🎓 ACADEMIC DISSERTATION ANALYSIS FRAMEWORK")
-    print("=" * 60)
-    print("Quantitative Assessment of Real-Time Moderation Systems")
-    print("=" * 60)
+    log_level = logging.WARNING if args.quiet else logging.INFO
+    configure_logging(log_level)
+    
+    logger.info("🎓 ACADEMIC DISSERTATION ANALYSIS FRAMEWORK")
+    logger.info(_BANNER)
+    logger.info("Quantitative Assessment of Real-Time Moderation Systems")
+    logger.info(_BANNER)
     
     # Setup environment
     if not args.skip_setup:
@@ -437,31 +610,35 @@ def main():
     results = {}
     
     # Run analyses based on arguments
-    if not any([args.evaluation_only, args.experiment_only]):
-        results['statistical'] = run_statistical_analysis()
-    
-    if not any([args.analysis_only, args.experiment_only]):
-        evaluator, metrics = run_model_evaluation()
-        results['evaluation'] = {'evaluator': evaluator, 'metrics': metrics}
-    
-    if not any([args.analysis_only, args.evaluation_only]):
-        designer, analysis = run_experimental_analysis()
-        results['experimental'] = {'designer': designer, 'analysis': analysis}
-    
-    # Generate comprehensive report
-    generate_comprehensive_report()
-    
-    print("\n" + "="*60)
-    print("✅ ACADEMIC ANALYSIS COMPLETE")
-    print("="*60)
-    print(f"📁 Reports available in: {args.output_dir}")
-    print("📊 Key outputs:")
-    print("   - Statistical Analysis: statistical_summary.md")
-    print("   - Model Evaluation: model_evaluation_report.md")
-    print("   - Experimental Results: experiment_*.png")
-    print("   - Comprehensive Report: comprehensive_academic_report.md")
-    print("   - Visualizations: *_analysis.png")
-    print("\n🎓 Ready for academic dissertation use!")
+    stages = {}
+    if not (args.evaluation_only or args.experiment_only):
+        stages['statistical'] = run_statistical_analysis
+    
+    if not (args.analysis_only or args.experiment_only):
+        stages['evaluation'] = run_model_evaluation
+    
+    if not (args.analysis_only or args.evaluation_only):
+        stages['experimental'] = run_experimental_analysis
+    
+    outcomes = asyncio.run(_run_stages(stages, log_level))
+    
+    if 'statistical' in outcomes:
+        results['statistical'] = outcomes['statistical']
+    
+    if 'evaluation' in outcomes:
+        results['evaluation'] = {'metrics': outcomes['evaluation']}
+    
+    if 'experimental' in outcomes:
+        results['experimental'] = {'analysis': outcomes['experimental']}
+    
+    logger.info("\n" + _BANNER)
+    logger.info("✅ ACADEMIC ANALYSIS COMPLETE")
+    logger.info(_BANNER)
+    failed = [name for name in stages if name not in outcomes]
+    if failed:
+        logger.warning(f"⚠️  Stages that failed: {', '.join(failed)} (see errors above)")
+    logger.info(f"📁 Reports available in: {args.output_dir}")
+    logger.info(_OUTPUTS_BANNER)
 
 if __name__ == "__main__":
     main()
@@ -4,61 +4,196 @@ Comprehensive Analysis Runner
 ============================
 
 This script runs all analysis scripts in the correct order, creates necessary directories,
-and provides comprehensive reporting and error handling.
+and provides comprehensive reporting and error handling. Independent scripts run in
+parallel waves; a wave only starts once every script in the previous wave has finished.
 
 Usage:
-    python run_all_analysis.py [--verbose] [--skip-errors]
+    python run_all_analysis.py [--verbose] [--skip-errors] [--pooled]
     
 Options:
     --verbose: Enable detailed output
     --skip-errors: Continue running other scripts if one fails
+    --pooled: Run scripts in forked workers that inherit pre-imported packages (Linux/macOS)
 """
 
 import os
 import sys
+import selectors
 import subprocess
 import argparse
+import importlib.util
+import json
+import multiprocessing
+import runpy
+import signal
+import threading
 import time
+import traceback
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
+SCRIPT_TIMEOUT = 300  # 5 minute timeout per script
+LOG_CHUNK_SIZE = 65536  # Flush buffered child output to the log in 64KB chunks...
+LOG_FLUSH_LINES = 100   # ...or every 100 lines, whichever comes first
+DRAIN_TIMEOUT = 5  # Seconds to keep reading a script's output pipes once it has exited or been killed
+
+STATUS_EMOJI = {
+    "SUCCESS": "✅",
+    "FAILED": "❌",
+    "SKIPPED": "⏭️",
+    "ERROR": "🚫",
+    "TIMEOUT": "⏰"
+}
+
+def run_script_in_worker(analysis_dir, script_file, log_path):
+    """Run an analysis script as __main__ inside a pooled worker.
+    
+    The worker's stdout goes straight to the script's log file. Its stderr
+    is teed into the log and collected, so a failing script reports what
+    it printed even when it exits without raising.
+    Returns (returncode, stderr) like a subprocess would.
+    """
+    os.chdir(analysis_dir)
+    sys.path.insert(0, analysis_dir)
+    sys.argv = [script_file]
+    stderr_output = bytearray()
+    
+    with open(log_path, 'wb') as log_file:
+        def tee_stderr():
+            while chunk := os.read(read_fd, LOG_CHUNK_SIZE):
+                stderr_output.extend(chunk)
+                os.write(log_file.fileno(), chunk)
+            os.close(read_fd)
+        
+        sys.stdout.flush()
+        sys.stderr.flush()
+        read_fd, write_fd = os.pipe()
+        os.dup2(log_file.fileno(), 1)
+        os.dup2(write_fd, 2)
+        os.close(write_fd)
+        tee = threading.Thread(target=tee_stderr, daemon=True)
+        tee.start()
+        
+        try:
+            runpy.run_path(script_file, run_name="__main__")
+            returncode = 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                returncode = e.code or 0
+            else:
+                sys.stderr.write(f"{e.code}\n")
+                returncode = 1
+        except BaseException:
+            sys.stderr.write(traceback.format_exc())
+            returncode = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            # Closing the pipe's last write end lets the tee drain and stop
+            os.dup2(log_file.fileno(), 2)
+            tee.join(DRAIN_TIMEOUT)
+    
+    return returncode, stderr_output.decode(errors="replace")
+
+def _send_worker_result(conn, analysis_dir, script_file, log_path):
+    """Forked worker entry point: run the script and send its result back.
+    
+    The worker leads its own process group so a timeout also reaches any
+    processes the script itself started.
+    """
+    os.setpgrp()
+    try:
+        conn.send(run_script_in_worker(analysis_dir, script_file, log_path))
+    finally:
+        conn.close()
+
+def run_script_in_fork(fork_context, analysis_dir, script_file, log_path, timeout):
+    """Run an analysis script in its own worker process and wait for it.
+    
+    Unlike a pool slot, a dedicated worker can be killed when the script
+    overruns, so a timed-out script stops using the server and writing to
+    reports/ before the next wave starts. Raises multiprocessing.TimeoutError
+    after the worker has been terminated.
+    """
+    receiver, sender = fork_context.Pipe(duplex=False)
+    worker = fork_context.Process(
+        target=_send_worker_result,
+        args=(sender, analysis_dir, script_file, log_path)
+    )
+    worker.start()
+    sender.close()
+    
+    try:
+        if receiver.poll(timeout):
+            return receiver.recv()
+        
+        # Overran: stop the whole process group, escalating if SIGTERM is ignored
+        for sig in (signal.SIGTERM, signal.SIGKILL):
+            try:
+                os.killpg(worker.pid, sig)
+            except ProcessLookupError:
+                break
+            worker.join(5)
+            if not worker.is_alive():
+                break
+        raise multiprocessing.TimeoutError(f"{script_file} timed out after {timeout}s")
+    finally:
+        receiver.close()
+        worker.join()
+
 class AnalysisRunner:
+    # Packages the analysis scripts import; probed once per process
+    required_modules = ("matplotlib", "pandas", "numpy", "seaborn", "scipy")
+    _missing_modules = None
+    
     def __init__(self, verbose=False, skip_errors=False):
         self.verbose = verbose
         self.skip_errors = skip_errors
         self.analysis_dir = Path(__file__).parent
         self.reports_dir = self.analysis_dir / "reports"
+        self.progress_path = self.reports_dir / "analysis_progress.jsonl"
         self.results = []
         
-        # Define the scripts to run in order
+        # Define the scripts to run in order; scripts in the same wave are
+        # independent and run concurrently, later waves consume their outputs
         self.scripts = [
             {
                 "name": "Model Evaluation (Real Dataset)",
+                "wave": 1,
                 "file": "model_evaluation_real.py",
                 "description": "Evaluates model performance using real dataset and generates metrics"
             },
             {
                 "name": "Statistical Analysis",
+                "wave": 1,
                 "file": "statistical_analysis.py",
                 "description": "Performs statistical analysis on moderation results"
             },
             {
                 "name": "Experimental Design",
+                "wave": 1,
                 "file": "experimental_design.py",
                 "description": "Runs experimental design analysis"
             },
             {
+                # Reuses reports/model_evaluation_real_* from wave 1, so it must
+                # not start until the real-dataset evaluation has finished
                 "name": "Academic Analysis",
+                "wave": 2,
                 "file": "run_academic_analysis.py",
                 "description": "Comprehensive academic analysis and reporting"
             },
             {
                 "name": "Export for Dissertation",
+                "wave": 3,
                 "file": "export_for_dissertation.py",
                 "description": "Exports results in dissertation format"
             },
             {
                 "name": "View Results",
+                "wave": 3,
                 "file": "view_results.py",
                 "description": "Displays and summarizes all results"
             }
@@ -80,23 +215,103 @@ class AnalysisRunner:
                 print(f"✓ Created/verified directory: {directory}")
     
     def check_dependencies(self):
-        """Check if required dependencies are installed"""
-        try:
-            import matplotlib
-            import pandas
-            import numpy
-            import seaborn
-            import scipy
-            if self.verbose:
-                print("✓ All required dependencies are available")
-            return True
-        except ImportError as e:
-            print(f"❌ Missing dependency: {e}")
+        """Check if required dependencies are installed.
+        
+        Uses importlib.util.find_spec so the runner only checks that the
+        packages are importable; the child scripts do the actual importing.
+        """
+        if AnalysisRunner._missing_modules is None:
+            AnalysisRunner._missing_modules = [
+                module for module in self.required_modules
+                if importlib.util.find_spec(module) is None
+            ]
+        
+        if AnalysisRunner._missing_modules:
+            print(f"❌ Missing dependencies: {', '.join(AnalysisRunner._missing_modules)}")
             print("Please install requirements: pip install -r requirements.txt")
             return False
+        
+        if self.verbose:
+            print("✓ All required dependencies are available")
+        return True
     
-    def run_script(self, script_info):
-        """Run a single analysis script"""
+    def stream_output(self, process, log_file, script_file, timeout):
+        """Stream a child's stdout/stderr into its log file.
+        
+        Output is read from the non-blocking pipes in raw chunks and written to
+        the log in batches rather than once per line. Output is echoed live in
+        verbose mode. Returns the collected stderr and raises
+        subprocess.TimeoutExpired when the timeout elapses, after killing the
+        child's whole process group (the child must be started with
+        start_new_session=True) and draining its pipes for at most
+        DRAIN_TIMEOUT seconds.
+        """
+        pending = bytearray()
+        pending_lines = 0
+        stderr_output = bytearray()
+        partial_lines = {"stdout": b"", "stderr": b""}
+        timed_out = False
+        deadline = time.monotonic() + timeout
+        
+        with selectors.DefaultSelector() as selector:
+            for name, pipe in (("stdout", process.stdout), ("stderr", process.stderr)):
+                os.set_blocking(pipe.fileno(), False)
+                selector.register(pipe.fileno(), selectors.EVENT_READ, name)
+            
+            while selector.get_map():
+                now = time.monotonic()
+                if now >= deadline:
+                    if timed_out:
+                        # Something outside the group still holds the pipes
+                        break
+                    # Kill the script and any workers it started, which
+                    # would otherwise keep the pipes open after it dies
+                    timed_out = True
+                    try:
+                        os.killpg(process.pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
+                    deadline = now + DRAIN_TIMEOUT
+                
+                for key, _ in selector.select(timeout=deadline - time.monotonic()):
+                    try:
+                        chunk = os.read(key.fd, LOG_CHUNK_SIZE)
+                    except BlockingIOError:
+                        continue
+                    if not chunk:
+                        selector.unregister(key.fd)
+                        continue
+                    
+                    pending += chunk
+                    pending_lines += chunk.count(b"\n")
+                    if key.data == "stderr":
+                        stderr_output += chunk
+                    if self.verbose:
+                        *lines, partial_lines[key.data] = (partial_lines[key.data] + chunk).split(b"\n")
+                        for line in lines:
+                            print(f"[{script_file}] {line.decode(errors='replace')}")
+                    
+                    if len(pending) >= LOG_CHUNK_SIZE or pending_lines >= LOG_FLUSH_LINES:
+                        log_file.write(pending)
+                        pending.clear()
+                        pending_lines = 0
+        
+        process.wait()
+        process.stdout.close()
+        process.stderr.close()
+        log_file.write(pending)
+        log_file.flush()
+        if self.verbose:
+            for line in partial_lines.values():
+                if line:
+                    print(f"[{script_file}] {line.decode(errors='replace')}")
+        
+        if timed_out:
+            raise subprocess.TimeoutExpired(process.args, timeout)
+        return stderr_output.decode(errors="replace")
+    
+    def run_script(self, script_info, fork_context=None):
+        """Run a single analysis script, in a forked worker if a fork context is given"""
         script_name = script_info["name"]
         script_file = script_info["file"]
         script_path = self.analysis_dir / script_file
@@ -116,37 +331,44 @@ class AnalysisRunner:
         print(f"Description: {script_info['description']}")
         print(f"{'='*60}")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
+        
+        log_path = self.analysis_dir / "logs" / f"{script_file}.log"
         
         try:
-            # Change to analysis directory to ensure relative paths work
-            original_cwd = os.getcwd()
-            os.chdir(self.analysis_dir)
-            
-            # Run the script
-            result = subprocess.run(
-                [sys.executable, script_file],
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
-            )
+            if fork_context is not None:
+                returncode, stderr = run_script_in_fork(
+                    fork_context, str(self.analysis_dir), script_file,
+                    str(log_path), SCRIPT_TIMEOUT
+                )
+            else:
+                # Run the script from the analysis directory and stream its
+                # output to the log instead of buffering it in memory
+                with open(log_path, 'wb', buffering=LOG_CHUNK_SIZE) as log_file:
+                    process = subprocess.Popen(
+                        [sys.executable, script_file],
+                        cwd=self.analysis_dir,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        start_new_session=True
+                    )
+                    stderr = self.stream_output(process, log_file, script_file, SCRIPT_TIMEOUT)
+                returncode = process.returncode
             
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
-            if result.returncode == 0:
+            if returncode == 0:
                 status = "SUCCESS"
                 message = "Completed successfully"
-                if self.verbose and result.stdout:
-                    print("STDOUT:", result.stdout)
             else:
                 status = "FAILED"
-                message = f"Exit code: {result.returncode}"
-                if result.stderr:
-                    message += f"\nError: {result.stderr}"
+                message = f"Exit code: {returncode}"
+                if stderr:
+                    message += f"\nError: {stderr}"
                 print(f"❌ {script_name} failed:")
-                print(f"   Exit code: {result.returncode}")
-                if result.stderr:
-                    print(f"   Error: {result.stderr}")
+                print(f"   Exit code: {returncode}")
+                if stderr:
+                    print(f"   Error: {stderr}")
             
             return {
                 "name": script_name,
@@ -154,17 +376,18 @@ class AnalysisRunner:
                 "status": status,
                 "message": message,
                 "duration": duration,
-                "stdout": result.stdout if self.verbose else "",
-                "stderr": result.stderr
+                "log_file": str(log_path),
+                "stderr": stderr
             }
             
-        except subprocess.TimeoutExpired:
+        except (subprocess.TimeoutExpired, multiprocessing.TimeoutError):
             return {
                 "name": script_name,
                 "file": script_file,
                 "status": "TIMEOUT",
-                "message": "Script timed out after 5 minutes",
-                "duration": time.time() - start_time
+                "message": f"Script timed out after {SCRIPT_TIMEOUT // 60} minutes",
+                "log_file": str(log_path),
+                "duration": time.perf_counter() - start_time
             }
         except Exception as e:
             return {
@@ -172,55 +395,100 @@ class AnalysisRunner:
                 "file": script_file,
                 "status": "ERROR",
                 "message": str(e),
-                "duration": time.time() - start_time
+                "duration": time.perf_counter() - start_time
             }
-        finally:
-            os.chdir(original_cwd)
+    
+    def record_progress(self, result):
+        """Append a finished script's result to the JSONL progress file.
+        
+        Each line is flushed as soon as the script finishes, so a crashed or
+        interrupted run still leaves a record of everything that completed.
+        """
+        with open(self.progress_path, 'a') as f:
+            f.write(json.dumps(result) + "\n")
+    
+    def load_progress(self):
+        """Read the results recorded in the JSONL progress file, in script order"""
+        if not self.progress_path.exists():
+            return []
+        
+        script_order = {script["file"]: i for i, script in enumerate(self.scripts)}
+        with open(self.progress_path) as f:
+            results = [json.loads(line) for line in f if line.strip()]
+        results.sort(key=lambda r: script_order.get(r["file"], len(script_order)))
+        return results
     
     def generate_summary_report(self):
-        """Generate a summary report of all script executions"""
-        report_path = self.reports_dir / f"analysis_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        """Generate text and JSON summary reports from the progress file"""
+        results = self.load_progress()
+        generated = datetime.now()
+        report_path = self.reports_dir / f"analysis_summary_{generated.strftime('%Y%m%d_%H%M%S')}.txt"
+        json_path = self.reports_dir / "analysis_summary.json"
         
-        with open(report_path, 'w') as f:
-            f.write("MODERATION SYSTEM ANALYSIS SUMMARY\n")
-            f.write("=" * 50 + "\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total Scripts: {len(self.results)}\n\n")
-            
-            # Summary statistics
-            successful = sum(1 for r in self.results if r["status"] == "SUCCESS")
-            failed = sum(1 for r in self.results if r["status"] == "FAILED")
-            skipped = sum(1 for r in self.results if r["status"] == "SKIPPED")
-            errors = sum(1 for r in self.results if r["status"] == "ERROR")
-            timeouts = sum(1 for r in self.results if r["status"] == "TIMEOUT")
+        # Summary statistics, counted in a single pass
+        counts = Counter(r["status"] for r in results)
+        successful = counts.get("SUCCESS", 0)
+        failed = counts.get("FAILED", 0)
+        skipped = counts.get("SKIPPED", 0)
+        errors = counts.get("ERROR", 0)
+        timeouts = counts.get("TIMEOUT", 0)
+        
+        lines = [
+            "MODERATION SYSTEM ANALYSIS SUMMARY\n",
+            "=" * 50 + "\n",
+            f"Generated: {generated.strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"Total Scripts: {len(results)}\n\n",
+            "SUMMARY STATISTICS:\n",
+            f"  ✓ Successful: {successful}\n",
+            f"  ❌ Failed: {failed}\n",
+            f"  ⏭️  Skipped: {skipped}\n",
+            f"  🚫 Errors: {errors}\n",
+            f"  ⏰ Timeouts: {timeouts}\n\n",
+            # Detailed results
+            "DETAILED RESULTS:\n",
+            "-" * 50 + "\n",
+        ]
+        
+        for result in results:
+            lines.extend([
+                f"\nScript: {result['name']}\n",
+                f"File: {result['file']}\n",
+                f"Status: {result['status']}\n",
+                f"Duration: {result['duration']:.2f} seconds\n",
+                f"Message: {result['message']}\n",
+            ])
             
-            f.write("SUMMARY STATISTICS:\n")
-            f.write(f"  ✓ Successful: {successful}\n")
-            f.write(f"  ❌ Failed: {failed}\n")
-            f.write(f"  ⏭️  Skipped: {skipped}\n")
-            f.write(f"  🚫 Errors: {errors}\n")
-            f.write(f"  ⏰ Timeouts: {timeouts}\n\n")
+            if result.get('log_file'):
+                lines.append(f"Log File: {result['log_file']}\n")
             
-            # Detailed results
-            f.write("DETAILED RESULTS:\n")
-            f.write("-" * 50 + "\n")
+            if result.get('stderr'):
+                lines.append(f"Error Details: {result['stderr']}\n")
             
-            for result in self.results:
-                f.write(f"\nScript: {result['name']}\n")
-                f.write(f"File: {result['file']}\n")
-                f.write(f"Status: {result['status']}\n")
-                f.write(f"Duration: {result['duration']:.2f} seconds\n")
-                f.write(f"Message: {result['message']}\n")
-                
-                if result.get('stderr'):
-                    f.write(f"Error Details: {result['stderr']}\n")
-                
-                f.write("-" * 30 + "\n")
+            lines.append("-" * 30 + "\n")
+        
+        with open(report_path, 'w') as f:
+            f.writelines(lines)
+        
+        summary = {
+            "generated": generated.isoformat(),
+            "total_scripts": len(results),
+            "counts": {
+                "SUCCESS": successful,
+                "FAILED": failed,
+                "SKIPPED": skipped,
+                "ERROR": errors,
+                "TIMEOUT": timeouts
+            },
+            "results": results
+        }
+        with open(json_path, 'w') as f:
+            json.dump(summary, f, indent=2)
         
         print(f"\n📊 Summary report saved to: {report_path}")
+        print(f"📊 JSON summary saved to: {json_path}")
         return report_path
     
-    def run_all(self):
+    def run_all(self, fork_context=None):
         """Run all analysis scripts"""
         print("🚀 Starting Moderation System Analysis")
         print(f"Analysis Directory: {self.analysis_dir}")
@@ -234,29 +502,45 @@ class AnalysisRunner:
         if not self.check_dependencies():
             return False
         
+        # Start a fresh progress file for this run
+        self.progress_path.unlink(missing_ok=True)
+        
         # Run scripts
         print(f"\n🏃 Running {len(self.scripts)} analysis scripts...")
         
-        for i, script_info in enumerate(self.scripts, 1):
-            print(f"\n[{i}/{len(self.scripts)}] Processing: {script_info['name']}")
-            
-            result = self.run_script(script_info)
-            self.results.append(result)
+        script_order = {script["file"]: i for i, script in enumerate(self.scripts)}
+        waves = sorted({script["wave"] for script in self.scripts})
+        
+        for wave in waves:
+            wave_scripts = [script for script in self.scripts if script["wave"] == wave]
+            max_workers = min(len(wave_scripts), os.cpu_count() or 1)
+            print(f"\n🌊 Wave {wave}: running {len(wave_scripts)} scripts with {max_workers} workers")
             
-            # Print immediate result
-            status_emoji = {
-                "SUCCESS": "✅",
-                "FAILED": "❌", 
-                "SKIPPED": "⏭️",
-                "ERROR": "🚫",
-                "TIMEOUT": "⏰"
-            }
+            wave_results = []
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {}
+                for script_info in wave_scripts:
+                    position = script_order[script_info["file"]] + 1
+                    print(f"\n[{position}/{len(self.scripts)}] Processing: {script_info['name']}")
+                    futures[executor.submit(self.run_script, script_info, fork_context)] = script_info
+                
+                for future in as_completed(futures):
+                    result = future.result()
+                    wave_results.append(result)
+                    self.record_progress(result)
+                    
+                    # Print immediate result
+                    emoji = STATUS_EMOJI.get(result["status"], "❓")
+                    print(f"{emoji} {result['name']}: {result['status']} ({result['duration']:.2f}s)")
             
-            emoji = status_emoji.get(result["status"], "❓")
-            print(f"{emoji} {result['name']}: {result['status']} ({result['duration']:.2f}s)")
+            # Keep the report in script order regardless of completion order
+            wave_results.sort(key=lambda r: script_order[r["file"]])
+            self.results.extend(wave_results)
             
-            if result["status"] in ["FAILED", "ERROR"] and not self.skip_errors:
-                print(f"\n🛑 Stopping execution due to error in {result['name']}")
+            failures = [r for r in wave_results if r["status"] in ["FAILED", "ERROR"]]
+            if failures and not self.skip_errors:
+                failed_names = ", ".join(r["name"] for r in failures)
+                print(f"\n🛑 Stopping execution due to error in {failed_names}")
                 print(f"Use --skip-errors flag to continue despite errors")
                 break
         
@@ -265,7 +549,8 @@ class AnalysisRunner:
         summary_path = self.generate_summary_report()
         
         # Final summary
-        successful = sum(1 for r in self.results if r["status"] == "SUCCESS")
+        counts = Counter(r["status"] for r in self.results)
+        successful = counts.get("SUCCESS", 0)
         total = len(self.results)
         
         print(f"\n🎉 Analysis Complete!")
@@ -275,15 +560,41 @@ class AnalysisRunner:
         
         return successful == total
 
+    def run_all_pooled(self):
+        """Run all analysis scripts in forkserver workers with packages pre-imported.
+        
+        The heavy packages are imported once by the fork server; each worker
+        forked from it inherits them instead of paying interpreter startup and
+        imports per script. Workers are forked by that single-threaded server
+        rather than by this process's scheduling threads, which avoids the
+        fork-with-threads deadlock hazard. Every worker runs a single script and
+        is then replaced, so scripts never see each other's global state, and a
+        script that times out is killed along with its worker.
+        """
+        if sys.platform == "win32":
+            print("⚠️  Pooled mode needs fork; falling back to subprocesses")
+            return self.run_all()
+        
+        if not self.check_dependencies():
+            return False
+        
+        print("\n🔥 Pre-importing analysis packages for pooled workers...")
+        fork_context = multiprocessing.get_context("forkserver")
+        fork_context.set_forkserver_preload(list(self.required_modules))
+        
+        return self.run_all(fork_context=fork_context)
+
 def main():
     parser = argparse.ArgumentParser(description="Run all moderation system analysis scripts")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose output")
     parser.add_argument("--skip-errors", "-s", action="store_true", help="Continue running scripts even if some fail")
     
+    parser.add_argument("--pooled", "-p", action="store_true", help="Run scripts in pre-warmed forked workers")
+    
     args = parser.parse_args()
     
     runner = AnalysisRunner(verbose=args.verbose, skip_errors=args.skip_errors)
-    success = runner.run_all()
+    success = runner.run_all_pooled() if args.pooled else runner.run_all()
     
     sys.exit(0 if success else 1)
 
@@ -56,6 +56,10 @@ class UserMessage(BaseModel):
     channel_id: str = "web-chat"
     metadata: Dict[str, Any] = None
 
+class UserMessageBatch(BaseModel):
+    messages: List[UserMessage]
+    channel_id: Optional[str] = None  # Overrides each message's channel when set
+
 class MessageGenerator:
     def __init__(self, sample_data_path: str = "/app/data/sample_messages.json"):
         self.sample_data_path = sample_data_path
@@ -419,6 +423,24 @@ async def send_user_message(user_message: UserMessage):
         logger.error(f"Error processing user message: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/send-messages-batch")
+async def send_user_messages_batch(batch: UserMessageBatch):
+    """Send a batch of user messages through the moderation pipeline concurrently"""
+    async def process_user_message(user_message: UserMessage) -> Dict[str, Any]:
+        try:
+            if batch.channel_id:
+                user_message.channel_id = batch.channel_id
+            message = simulator.message_generator.create_user_message(user_message)
+            result = await simulator.process_message(message)
+            await simulator.broadcast_message(result)
+            return {"status": "success", "result": result}
+        except Exception as e:
+            logger.error(f"Error processing batched user message: {str(e)}")
+            return {"status": "error", "detail": str(e)}
+    
+    results = await asyncio.gather(*[process_user_message(m) for m in batch.messages])
+    return {"status": "success", "results": results}
+
 @app.post("/simulate/single")
 async def simulate_single_message(message_type: str = "normal"):
     """Generate and process a single message"""
@@ -0,0 +1,154 @@
+"""
+Tests for the academic analysis runner in the full-analysis-* directories.
+
+Each stage runs in a worker process, so whatever it returns is pickled back
+to the parent. These tests replace the heavy analysis modules with small
+fakes that carry unpicklable state (like the evaluator's asyncio objects)
+and check that every stage still returns plain, picklable data. They also
+check that the runner's logging setup stays scoped to its own logger.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import pickle
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+RUNNERS = sorted(ROOT.glob("full-analysis-*/run_academic_analysis.py"))
+
+
+def _unpicklable():
+    """State the real analyzers hold that cannot cross a process boundary."""
+    return lambda: None
+
+
+class FakeAnalyzer:
+    def __init__(self):
+        self.hook = _unpicklable()
+        self.results = {}
+
+    def generate_performance_report(self, output_dir):
+        self.results['classification'] = {'accuracy': 0.9}
+
+
+class FakeEvaluator:
+    def __init__(self, resource_friendly=False):
+        self.concurrency = asyncio.Condition()
+        self.hook = _unpicklable()
+
+    def collect_evaluation_data(self, test_messages):
+        return {'results': list(test_messages)}
+
+    def create_evaluation_visualizations(self, output_dir):
+        return {'accuracy': 0.8, 'f1_score': 0.75}
+
+    def generate_academic_report(self, output_dir):
+        pass
+
+
+class FakeDatasetLoader:
+    def __init__(self, csv_path=None):
+        pass
+
+    def get_full_dataset(self):
+        return [("hello", "non_toxic", {})]
+
+
+class FakeDesigner:
+    def __init__(self):
+        self.hook = _unpicklable()
+
+    def design_controlled_experiment(self, name, conditions):
+        return {'name': name, 'conditions': conditions}
+
+    def generate_experimental_dataset(self, size=30, toxicity_rate=0.3):
+        return []
+
+    def run_performance_experiment(self, name, dataset, batch_sizes):
+        return {int(bs): {} for bs in batch_sizes}
+
+    def analyze_experiment_results(self, name):
+        return {'experiment_name': name, 'recommendations': []}
+
+    def create_experiment_visualizations(self, name, output_dir):
+        pass
+
+
+def _fake_module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    return module
+
+
+@pytest.fixture(params=RUNNERS, ids=lambda path: path.parent.name)
+def runner(request, monkeypatch, tmp_path):
+    """Load one copy of the runner against fake analysis modules, inside tmp_path."""
+    for name, attrs in {
+        'statistical_analysis': {'ModerationSystemAnalyzer': FakeAnalyzer},
+        'model_evaluation_real': {'ModelPerformanceEvaluator': FakeEvaluator},
+        'dataset_loader': {'DissertationDatasetLoader': FakeDatasetLoader},
+        'experimental_design': {'ExperimentalDesign': FakeDesigner},
+    }.items():
+        monkeypatch.setitem(sys.modules, name, _fake_module(name, **attrs))
+
+    monkeypatch.setattr(sys, 'path', list(sys.path))
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "analysis" / "reports").mkdir(parents=True)
+
+    spec = importlib.util.spec_from_file_location(
+        f"run_academic_analysis_{request.param.parent.name.replace('-', '_')}",
+        request.param,
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _round_trip(value):
+    return pickle.loads(pickle.dumps(value))
+
+
+def test_statistical_stage_result_pickles(runner):
+    result = runner.run_statistical_analysis()
+    assert _round_trip(result) == {'classification': {'accuracy': 0.9}}
+
+
+def test_evaluation_stage_fallback_result_pickles(runner):
+    # No reports/model_evaluation_real_* in tmp_path, so a fresh evaluation runs
+    result = runner.run_model_evaluation()
+    assert _round_trip(result) == {'accuracy': 0.8, 'f1_score': 0.75}
+
+
+def test_evaluation_stage_reuse_result_pickles(runner, tmp_path):
+    reports = tmp_path / "reports"
+    reports.mkdir()
+    (reports / "model_evaluation_real_report.md").write_text(
+        "- **Evaluation Sample Size**: 60 samples\n- **Accuracy**: 0.7833 (78.3%)\n"
+    )
+    (reports / "model_evaluation_real.png").write_bytes(b"\x89PNG")
+
+    result = runner.run_model_evaluation()
+    assert _round_trip(result) == {'sample_size': 60, 'accuracy': 0.7833}
+
+
+def test_experimental_stage_result_pickles(runner):
+    result = runner.run_experimental_analysis()
+    assert _round_trip(result) == {
+        'experiment_name': 'System_Performance_Analysis',
+        'recommendations': [],
+    }
+
+
+def test_configure_logging_leaves_library_loggers_alone(runner):
+    runner.configure_logging()
+    try:
+        assert runner.logger.isEnabledFor(logging.INFO)
+        assert not logging.getLogger("httpx").isEnabledFor(logging.INFO)
+        assert logging.getLogger().level == logging.WARNING
+    finally:
+        runner.logger.handlers.clear()